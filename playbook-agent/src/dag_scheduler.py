@@ -1,9 +1,11 @@
 """DAG Scheduler — dependency graph validation and ready-step computation.
 
 Provides:
+  - DagIndex: Adjacency and lookup tables built once per run.
   - validate_dag(): Cycle detection and reference validation at startup.
   - get_ready_steps(): Returns launchable steps based on current completion state.
-  - get_transitive_dependents(): BFS for failure cascade (skip downstream).
+  - ReadyQueue: Event-driven ready set fed by step completions.
+  - get_transitive_dependents(): Memoized walk for failure cascade (skip downstream).
   - is_blocked(): Checks if a step can never run due to failed dependencies.
 
 No external dependencies beyond the project's own playbook_parser.StepDef.
@@ -11,6 +13,10 @@ No external dependencies beyond the project's own playbook_parser.StepDef.
 
 from __future__ import annotations
 
+import heapq
+from array import array
+from collections import deque
+
 from src.playbook_parser import StepDef
 
 
@@ -28,53 +34,90 @@ class CyclicDependencyError(Exception):
 
 
 # ---------------------------------------------------------------------------
-# DAG validation
+# Graph index
 # ---------------------------------------------------------------------------
 
 
-def _find_cycle(steps: list[StepDef]) -> list[str]:
-    """DFS-based cycle finder.  Returns a list of step IDs forming the cycle."""
-    adj: dict[str, list[str]] = {s.id: list(s.dependencies) for s in steps}
-    WHITE, GRAY, BLACK = 0, 1, 2
-    color: dict[str, int] = {s.id: WHITE for s in steps}
-    parent: dict[str, str | None] = {}
-
-    def dfs(node: str) -> list[str] | None:
-        color[node] = GRAY
-        for dep in adj[node]:
-            if color[dep] == GRAY:
-                # Back-edge → cycle found.  Trace the path.
-                cycle = [dep, node]
-                current = node
-                while parent.get(current) and parent[current] != dep:
-                    current = parent[current]
-                    cycle.append(current)
-                cycle.reverse()
-                return cycle
-            if color[dep] == WHITE:
-                parent[dep] = node
-                result = dfs(dep)
-                if result:
-                    return result
-        color[node] = BLACK
-        return None
+class DagIndex:
+    """Precomputed lookup tables for a playbook's step graph.
+
+    Built once at run start and passed to every scheduler call so the
+    adjacency is not rebuilt on each scheduling tick or failure cascade.
+    """
+
+    def __init__(self, steps: list[StepDef]) -> None:
+        self.steps = steps
+        self.step_map: dict[str, StepDef] = {s.id: s for s in steps}
+        self.in_degree: dict[str, int] = {s.id: 0 for s in steps}
+        # Frozen dependency sets allow C-level subset/disjoint checks per tick
+        self.dep_sets: dict[str, frozenset[str]] = {
+            s.id: frozenset(s.dependencies) for s in steps
+        }
+        # step → steps that depend on it ("enables" adjacency)
+        self.dependents: dict[str, list[str]] = {s.id: [] for s in steps}
+        # step → all transitive dependents, filled lazily by get_transitive_dependents()
+        self.reachable: dict[str, frozenset[str]] = {}
+
+        for step in steps:
+            for dep in step.dependencies:
+                # Unknown deps are tolerated here and reported by validate_dag()
+                self.dependents.setdefault(dep, []).append(step.id)
+                self.in_degree[step.id] += 1
+
+        # Integer-indexed CSR form of the "enables" adjacency for the graph
+        # algorithms: node i's dependents are indices[indptr[i]:indptr[i + 1]].
+        self.idx_to_id: list[str] = [s.id for s in steps]
+        self.id_to_idx: dict[str, int] = {sid: i for i, sid in enumerate(self.idx_to_id)}
+        self.indptr = array("i", [0])
+        self.indices = array("i")
+        for sid in self.idx_to_id:
+            self.indices.extend(self.id_to_idx[d] for d in self.dependents[sid])
+            self.indptr.append(len(self.indices))
+        self.in_degree_arr = array("i", (self.in_degree[sid] for sid in self.idx_to_id))
+
+
+# ---------------------------------------------------------------------------
+# DAG validation
+# ---------------------------------------------------------------------------
 
-    for step in steps:
-        if color[step.id] == WHITE:
-            result = dfs(step.id)
-            if result:
-                return result
-    return ["unknown"]
 
+def _find_cycle(index: DagIndex, in_degree: array) -> list[str]:
+    """Recover a sample cycle from the nodes Kahn's algorithm could not drain.
 
-def validate_dag(steps: list[StepDef]) -> None:
+    Every step left with ``in_degree > 0`` still has at least one undrained
+    dependency, so following any such dependency edge from a surviving step
+    must eventually revisit a step — closing the cycle.  Runs in
+    O(cycle length) instead of a second full DFS over the graph.
+    """
+    node = next((i for i, deg in enumerate(in_degree) if deg > 0), None)
+    if node is None:
+        return ["unknown"]
+
+    id_to_idx, idx_to_id = index.id_to_idx, index.idx_to_id
+    path: list[int] = []
+    position: dict[int, int] = {}
+    while node not in position:
+        position[node] = len(path)
+        path.append(node)
+        node = next(
+            id_to_idx[dep]
+            for dep in index.step_map[idx_to_id[node]].dependencies
+            if in_degree[id_to_idx[dep]] > 0
+        )
+
+    cycle = [idx_to_id[i] for i in path[position[node]:]]
+    return cycle if len(cycle) > 1 else cycle * 2  # self-loop: a -> a
+
+
+def validate_dag(index: DagIndex) -> None:
     """Validate that the step dependency graph is a valid DAG.
 
     Raises:
         CyclicDependencyError: if a cycle is detected.
         ValueError: if a dependency references a non-existent step ID.
     """
-    step_ids = {s.id for s in steps}
+    steps = index.steps
+    step_ids = index.step_map.keys()
 
     # Check for references to non-existent steps
     for step in steps:
@@ -85,29 +128,24 @@ def validate_dag(steps: list[StepDef]) -> None:
                     f"Valid step IDs: {sorted(step_ids)}"
                 )
 
-    # Kahn's algorithm — topological sort via in-degree counting
-    in_degree: dict[str, int] = {s.id: 0 for s in steps}
-    dependents: dict[str, list[str]] = {s.id: [] for s in steps}
+    # Kahn's algorithm — topological sort via in-degree counting, on the
+    # integer CSR adjacency
+    in_degree = array("i", index.in_degree_arr)
+    indptr, indices = index.indptr, index.indices
 
-    for step in steps:
-        for dep in step.dependencies:
-            dependents[dep].append(step.id)
-            in_degree[step.id] += 1
-
-    queue = [sid for sid, deg in in_degree.items() if deg == 0]
+    queue = deque(i for i, deg in enumerate(in_degree) if deg == 0)
     sorted_count = 0
 
     while queue:
-        node = queue.pop(0)
+        node = queue.popleft()
         sorted_count += 1
-        for dependent in dependents[node]:
+        for dependent in indices[indptr[node]:indptr[node + 1]]:
             in_degree[dependent] -= 1
             if in_degree[dependent] == 0:
                 queue.append(dependent)
 
     if sorted_count < len(steps):
-        cycle = _find_cycle(steps)
-        raise CyclicDependencyError(cycle)
+        raise CyclicDependencyError(_find_cycle(index, in_degree))
 
 
 # ---------------------------------------------------------------------------
@@ -116,7 +154,7 @@ def validate_dag(steps: list[StepDef]) -> None:
 
 
 def get_ready_steps(
-    steps: list[StepDef],
+    index: DagIndex,
     completed: set[str],
     failed: set[str],
     running: set[str],
@@ -133,46 +171,107 @@ def get_ready_steps(
     Returns steps sorted by ``order`` for deterministic launch ordering.
     """
     done = completed | failed | running
+    dep_sets = index.dep_sets
     ready = []
-    for step in steps:
+    for step in index.steps:
         if step.id in done:
             continue
-        if all(dep in completed for dep in step.dependencies):
+        if dep_sets[step.id] <= completed:
             ready.append(step)
     return sorted(ready, key=lambda s: s.order)
 
 
+class ReadyQueue:
+    """Event-driven ready set for a single run.
+
+    Tracks the number of unmet dependencies per step and only revisits the
+    dependents of a step when it completes, so scheduling work over the whole
+    run is O(V+E) instead of a full ``get_ready_steps`` scan on every tick.
+
+    Each step becomes ready at most once.  Steps with a failed dependency
+    never reach zero unmet dependencies, so they are never emitted.
+    """
+
+    def __init__(self, index: DagIndex) -> None:
+        self._index = index
+        self._position: dict[str, int] = {s.id: i for i, s in enumerate(index.steps)}
+        self._remaining: dict[str, int] = dict(index.in_degree)
+        self._completed: set[str] = set()
+        self._heap: list[tuple[int, int, str]] = []
+        for step in index.steps:
+            if self._remaining[step.id] == 0:
+                self._push(step)
+
+    def _push(self, step: StepDef) -> None:
+        # Position breaks ties between equal ``order`` values, matching a stable sort.
+        heapq.heappush(self._heap, (step.order, self._position[step.id], step.id))
+
+    def on_step_completed(self, step_id: str) -> list[StepDef]:
+        """Record a completed step and return the dependents it made ready."""
+        if step_id in self._completed:
+            return []
+        self._completed.add(step_id)
+
+        newly_ready: list[StepDef] = []
+        for dep_id in self._index.dependents.get(step_id, []):
+            self._remaining[dep_id] -= 1
+            if self._remaining[dep_id] == 0:
+                step = self._index.step_map[dep_id]
+                self._push(step)
+                newly_ready.append(step)
+        return newly_ready
+
+    def pop_ready(self) -> list[StepDef]:
+        """Drain and return all ready steps, sorted by ``order``."""
+        step_map = self._index.step_map
+        ready: list[StepDef] = []
+        while self._heap:
+            _, _, step_id = heapq.heappop(self._heap)
+            ready.append(step_map[step_id])
+        return ready
+
+
 # ---------------------------------------------------------------------------
 # Failure cascade
 # ---------------------------------------------------------------------------
 
 
-def get_transitive_dependents(step_id: str, steps: list[StepDef]) -> set[str]:
+def get_transitive_dependents(step_id: str, index: DagIndex) -> set[str]:
     """Return all step IDs that transitively depend on ``step_id``.
 
-    Uses BFS over the "enables" adjacency (step → steps that depend on it).
-    Used to skip all downstream steps when a step fails.
+    Walks the "enables" adjacency (step → steps that depend on it) in
+    post-order and memoizes each node's reachable set on the index, so a
+    node's set is the union of its children's cached sets.  Repeated calls
+    across a failure cascade therefore cost O(V+E) in total rather than a
+    fresh BFS per failure.  Used to skip all downstream steps when a step
+    fails.  The index must describe a validated (acyclic) graph.
     """
-    dependents: dict[str, list[str]] = {s.id: [] for s in steps}
-    for step in steps:
-        for dep in step.dependencies:
-            dependents[dep].append(step.id)
+    dependents = index.dependents
+    reachable = index.reachable
+
+    stack = [step_id]
+    while stack:
+        node = stack[-1]
+        if node in reachable:
+            stack.pop()
+            continue
+        children = dependents.get(node, [])
+        pending = [c for c in children if c not in reachable]
+        if pending:
+            stack.extend(pending)
+            continue
+        reach: set[str] = set(children)
+        for child in children:
+            reach |= reachable[child]
+        reachable[node] = frozenset(reach)
+        stack.pop()
 
-    visited: set[str] = set()
-    queue = [step_id]
-    while queue:
-        current = queue.pop(0)
-        for dep_id in dependents.get(current, []):
-            if dep_id not in visited:
-                visited.add(dep_id)
-                queue.append(dep_id)
-    return visited
+    return set(reachable[step_id])
 
 
-def is_blocked(step_id: str, steps: list[StepDef], failed: set[str]) -> bool:
+def is_blocked(step_id: str, index: DagIndex, failed: set[str]) -> bool:
     """Check whether a step is blocked because one of its dependencies failed."""
-    step_map = {s.id: s for s in steps}
-    step = step_map.get(step_id)
-    if step is None:
+    deps = index.dep_sets.get(step_id)
+    if deps is None:
         return True
-    return any(dep in failed for dep in step.dependencies)
+    return not deps.isdisjoint(failed)
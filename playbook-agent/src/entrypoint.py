@@ -9,10 +9,12 @@ import sys
 import traceback
 
 from src.firestore_client import (
+    FirestoreWriteBuffer,
     build_hydration_context,
+    flush_writes,
+    get_run_refs,
     update_run_status,
     write_event,
-    _get_db,
 )
 from src.hydration import hydrate_playbook
 from src.k8s_client import delete_configmap
@@ -20,8 +22,6 @@ from src.dag_scheduler import CyclicDependencyError
 from src.orchestrator import RunAbortedError, StepFailedError, run_orchestration
 from src.playbook_parser import parse_playbook_file
 
-from firebase_admin import firestore as fs
-
 PLAYBOOK_PATH = "/playbook/PLAYBOOK.md"
 HYDRATED_OUTPUT_PATH = "/shared/PLAYBOOK_HYDRATED.md"
 
@@ -37,18 +37,25 @@ def main() -> None:
 
     print(f"[playbook-agent] Starting run={run_id} org={org_id} playbook={playbook_id}")
 
+    # Startup writes are independent and all target the run doc tree, so they
+    # are batched.  The run status goes out first, so the app shows the run as
+    # running during parse and hydration; the parse/hydration writes are
+    # committed together right before orchestration begins.
+    startup = FirestoreWriteBuffer()
+
     try:
         # ---- Mark run as running ----
-        update_run_status(org_id, run_id, "running")
+        update_run_status(org_id, run_id, "running", buffer=startup)
         write_event(
             org_id, run_id, "playbook_started",
             payload={"playbookId": playbook_id},
+            buffer=startup,
         )
-        print("[playbook-agent] Wrote playbook_started event")
+        startup.flush()
 
         # ---- Parse PLAYBOOK.md ----
         playbook = parse_playbook_file(PLAYBOOK_PATH)
-        write_event(org_id, run_id, "progress", payload={
+        write_event(org_id, run_id, "progress", buffer=startup, payload={
             "message": (
                 f"Parsed playbook: {playbook.name} v{playbook.version} "
                 f"({len(playbook.steps)} steps, {len(playbook.variables)} variables)"
@@ -62,22 +69,38 @@ def main() -> None:
         # ---- Fetch context + hydrate template ----
         context = build_hydration_context(org_id, run_id, playbook.variables)
         resolved = hydrate_playbook(playbook, context, HYDRATED_OUTPUT_PATH)
-        write_event(org_id, run_id, "progress", payload={
+        write_event(org_id, run_id, "progress", buffer=startup, payload={
             "message": f"Template hydration complete: {len(resolved)} variables resolved",
             "hydratedVariables": resolved,
         })
         print(f"[playbook-agent] Hydrated {len(resolved)} variables → {HYDRATED_OUTPUT_PATH}")
 
         # Update run doc with hydrated context
-        db = _get_db()
-        db.collection("orgs").document(org_id) \
-            .collection("playbook_runs").document(run_id) \
-            .update({"context": resolved, "updatedAt": fs.SERVER_TIMESTAMP})
+        from firebase_admin import firestore as fs
+
+        startup.update(
+            get_run_refs(org_id, run_id).run_doc,
+            {"context": resolved, "updatedAt": fs.SERVER_TIMESTAMP},
+        )
+
+        startup_writes = len(startup)
+        startup.flush()
+        print(f"[playbook-agent] Committed {startup_writes} startup writes (parse + hydration)")
 
         # ---- Orchestrate steps ----
         namespace = os.environ.get("NAMESPACE", "skillmatic")
 
-        run_orchestration(playbook, org_id, run_id, namespace)
+        try:
+            run_orchestration(playbook, org_id, run_id, namespace)
+        finally:
+            # Step status + heartbeat updates are coalesced in the background.
+            # A failed flush is logged so it can't replace the orchestration
+            # outcome (StepFailedError, RunAbortedError) being raised.
+            try:
+                flush_writes()
+            except Exception:
+                print("[playbook-agent] Failed to commit queued status writes")
+                traceback.print_exc()
 
         # ---- Mark run as completed ----
         step_count = len(playbook.steps)
@@ -103,6 +126,7 @@ def main() -> None:
     except CyclicDependencyError as exc:
         print(f"[playbook-agent] FATAL: {exc}")
         try:
+            startup.flush()
             write_event(
                 org_id, run_id, "playbook_failed",
                 payload={"error": str(exc)},
@@ -123,6 +147,7 @@ def main() -> None:
         traceback.print_exc()
 
         try:
+            startup.flush()
             write_event(
                 org_id, run_id, "playbook_failed",
                 payload={"error": str(exc)},
@@ -2,25 +2,311 @@
 
 All paths follow: orgs/{orgId}/playbook_runs/{runId}/...
 Uses Application Default Credentials (Workload Identity on GKE).
+
+firebase_admin is imported lazily (first Firestore call) — it pulls in gRPC,
+protobuf and google-auth, which would otherwise add to every Job's cold start.
 """
 
-import time
+from __future__ import annotations
+
+import atexit
+import functools
+import itertools
+import threading
+import traceback
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 
-import firebase_admin
-from firebase_admin import firestore
+if TYPE_CHECKING:
+    import firebase_admin
+    from firebase_admin import firestore
 
 # ---------------------------------------------------------------------------
 # Initialisation (module-level singleton)
 # ---------------------------------------------------------------------------
 
 _app: firebase_admin.App | None = None
+_db: firestore.firestore.Client | None = None
+
+# Firestore rejects WriteBatch commits with more than 500 operations
+_MAX_BATCH_WRITES = 500
+
+# Events committed in one batch share a server timestamp; clientSeq orders them
+_event_seq = itertools.count()
 
 
 def _get_db() -> firestore.firestore.Client:
-    global _app
-    if _app is None:
-        _app = firebase_admin.initialize_app()
-    return firestore.client(_app)
+    """Return the process-wide Firestore client (one gRPC channel per run)."""
+    global _app, _db
+    if _db is None:
+        import firebase_admin
+        from firebase_admin import firestore
+
+        if _app is None:
+            _app = firebase_admin.initialize_app()
+        _db = firestore.client(_app)
+    return _db
+
+
+@dataclass(frozen=True)
+class RunRefs:
+    """Pre-built references for one run's document tree."""
+
+    run_doc: firestore.firestore.DocumentReference
+    steps_coll: firestore.firestore.CollectionReference
+    events_coll: firestore.firestore.CollectionReference
+    inputs_coll: firestore.firestore.CollectionReference
+
+    def step_doc(self, step_id: str) -> firestore.firestore.DocumentReference:
+        return self.steps_coll.document(step_id)
+
+
+@functools.lru_cache(maxsize=32)
+def get_run_refs(org_id: str, run_id: str) -> RunRefs:
+    """Return the (cached) references under orgs/{orgId}/playbook_runs/{runId}."""
+    run_doc = _get_db().collection("orgs").document(org_id) \
+        .collection("playbook_runs").document(run_id)
+    return RunRefs(
+        run_doc=run_doc,
+        steps_coll=run_doc.collection("steps"),
+        events_coll=run_doc.collection("events"),
+        inputs_coll=run_doc.collection("inputs"),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Batched writes
+# ---------------------------------------------------------------------------
+
+
+class FirestoreWriteBuffer:
+    """Accumulate set/update writes and commit them as WriteBatch round-trips.
+
+    Helpers that accept ``buffer=`` queue their write here instead of issuing
+    an RPC.  ``flush()`` commits everything queued so far in chunks of
+    _MAX_BATCH_WRITES (each chunk is atomic).
+    """
+
+    def __init__(self) -> None:
+        self._ops: list[tuple[str, object, dict]] = []
+
+    def __len__(self) -> int:
+        return len(self._ops)
+
+    def set(self, ref, data: dict) -> None:
+        self._ops.append(("set", ref, data))
+
+    def update(self, ref, data: dict) -> None:
+        self._ops.append(("update", ref, data))
+
+    def add(self, collection_ref, data: dict) -> str:
+        """Queue a create with an auto-generated ID.  Returns the new doc ID."""
+        doc_ref = collection_ref.document()
+        self._ops.append(("set", doc_ref, data))
+        return doc_ref.id
+
+    def flush(self) -> None:
+        """Commit all queued writes.  The queue is cleared even if a commit fails."""
+        ops, self._ops = self._ops, []
+        if not ops:
+            return
+        db = _get_db()
+        for start in range(0, len(ops), _MAX_BATCH_WRITES):
+            batch = db.batch()
+            for op, ref, data in ops[start:start + _MAX_BATCH_WRITES]:
+                if op == "set":
+                    batch.set(ref, data)
+                else:
+                    batch.update(ref, data)
+            batch.commit()
+
+
+# Statuses a delayed background write must never move a document out of
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "skipped", "aborted"})
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Whether a failed write is worth retrying (unavailable, timeout, contention)."""
+    from google.api_core import exceptions
+
+    return isinstance(exc, (
+        ConnectionError,
+        exceptions.Aborted,
+        exceptions.DeadlineExceeded,
+        exceptions.GatewayTimeout,
+        exceptions.InternalServerError,
+        exceptions.ServiceUnavailable,
+        exceptions.TooManyRequests,
+    ))
+
+
+def _update_unless_terminal(ref, data: dict) -> None:
+    """Apply a delayed update without moving the doc out of a terminal status.
+
+    A queued or retried "running" can reach Firestore after the step agent
+    has already written "completed" or "failed"; the status check and the
+    write share a transaction so that update is skipped instead.
+    """
+    from firebase_admin import firestore
+
+    if data.get("status") in (None, *_TERMINAL_STATUSES):
+        ref.update(data)
+        return
+
+    @firestore.transactional
+    def _apply(transaction) -> None:
+        snapshot = ref.get(field_paths=["status"], transaction=transaction)
+        current = (snapshot.to_dict() or {}).get("status")
+        if current in _TERMINAL_STATUSES:
+            print(f"[firestore] Skipping stale status {data['status']!r} for {ref.path} (already {current!r})")
+            return
+        transaction.update(ref, data)
+
+    _apply(_get_db().transaction())
+
+
+class FirestoreWriter:
+    """Background thread that coalesces document updates into batched commits.
+
+    ``update()`` merges into a per-document pending map (later fields override
+    earlier ones) and wakes the thread, which waits ``interval`` seconds for
+    more updates and then commits them through a FirestoreWriteBuffer, so
+    back-to-back step transitions and repeated heartbeats cost a single RPC
+    and never block the orchestrator loop.  The thread sleeps while nothing
+    is pending.
+
+    If the batch fails, each document is written on its own so one bad update
+    cannot hold back the rest.  Transient failures are put back ahead of newer
+    updates and retried with backoff, up to ``max_attempts`` times; other
+    failures are logged and dropped.  A ``flush()`` or ``close()`` that could
+    not commit everything raises the last error.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.2,
+        max_retry_delay: float = 5.0,
+        max_attempts: int = 5,
+    ) -> None:
+        self._interval = interval
+        self._max_retry_delay = max_retry_delay
+        self._max_attempts = max_attempts
+        # path -> (ref, merged fields, failed attempts so far)
+        self._pending: dict[str, tuple[object, dict, int]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def update(self, ref, data: dict) -> None:
+        if self._thread is None:
+            self._start()
+        with self._lock:
+            entry = self._pending.get(ref.path)
+            if entry is None:
+                self._pending[ref.path] = (ref, dict(data), 0)
+            else:
+                entry[1].update(data)
+        self._wake.set()
+
+    def flush(self) -> None:
+        """Commit everything queued so far (safe to call from any thread).
+
+        Raises if any update could not be committed; transient failures stay
+        queued for the next try.
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return
+            if not any(attempts for _, _, attempts in pending.values()):
+                try:
+                    buffer = FirestoreWriteBuffer()
+                    for ref, data, _ in pending.values():
+                        buffer.update(ref, data)
+                    buffer.flush()
+                    return
+                except Exception as exc:
+                    print(f"[firestore] Batched write failed ({exc}) — writing documents one by one")
+
+            error: Exception | None = None
+            retry: dict[str, tuple[object, dict, int]] = {}
+            for path, (ref, data, attempts) in pending.items():
+                try:
+                    _update_unless_terminal(ref, data)
+                except Exception as exc:
+                    error = exc
+                    if _is_transient(exc) and attempts + 1 < self._max_attempts:
+                        retry[path] = (ref, data, attempts + 1)
+                    else:
+                        print(f"[firestore] Dropping update to {path}: {exc}")
+            if retry:
+                self._requeue(retry)
+            if error is not None:
+                raise error
+
+    def close(self) -> None:
+        """Stop the background thread and commit whatever is still queued."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._max_retry_delay)
+        self.flush()
+
+    def _requeue(self, failed: dict[str, tuple[object, dict, int]]) -> None:
+        # Failed updates are older than anything queued since, so newer fields win
+        with self._lock:
+            for path, (ref, data, _) in self._pending.items():
+                entry = failed.get(path)
+                if entry is None:
+                    failed[path] = (ref, data, 0)
+                else:
+                    entry[1].update(data)
+            self._pending = failed
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="firestore-writer", daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        delay = self._interval
+        while not self._stop.is_set():
+            self._wake.wait()
+            # Short window so updates arriving back to back share one commit
+            if self._stop.wait(delay):
+                return
+            self._wake.clear()
+            try:
+                self.flush()
+                delay = self._interval
+            except Exception:
+                print("[firestore] Background write flush failed")
+                traceback.print_exc()
+                with self._lock:
+                    retrying = bool(self._pending)
+                if retrying:
+                    delay = min(delay * 2, self._max_retry_delay)
+                    print(f"[firestore] Retrying queued writes in {delay:.1f}s")
+                    self._wake.set()
+
+
+_writer = FirestoreWriter()
+atexit.register(_writer.close)
+
+
+def flush_writes() -> None:
+    """Commit any step status / heartbeat updates still queued in the background."""
+    _writer.flush()
 
 
 # ---------------------------------------------------------------------------
@@ -30,12 +316,26 @@ def _get_db() -> firestore.firestore.Client:
 
 def read_run(org_id: str, run_id: str) -> dict | None:
     """Read the root playbook_runs document."""
-    db = _get_db()
-    doc = db.collection("orgs").document(org_id) \
-        .collection("playbook_runs").document(run_id).get()
+    doc = get_run_refs(org_id, run_id).run_doc.get()
     return doc.to_dict() if doc.exists else None
 
 
+def _read_run_field(org_id: str, run_id: str, field: str):
+    """Read a single top-level field of the run doc via a field-mask projection.
+
+    Returns None if the run doc or the field is missing.
+    """
+    doc = get_run_refs(org_id, run_id).run_doc.get(field_paths=[field])
+    if not doc.exists:
+        return None
+    return (doc.to_dict() or {}).get(field)
+
+
+def read_run_status(org_id: str, run_id: str) -> str | None:
+    """Read only the run's status field (projection — skips the rest of the doc)."""
+    return _read_run_field(org_id, run_id, "status")
+
+
 def update_run_status(
     org_id: str,
     run_id: str,
@@ -44,9 +344,14 @@ def update_run_status(
     error: dict | None = None,
     summary: str | None = None,
     current_step_id: str | None = None,
+    buffer: FirestoreWriteBuffer | None = None,
 ) -> None:
-    """Update the run document status + updatedAt."""
-    db = _get_db()
+    """Update the run document status + updatedAt.
+
+    If ``buffer`` is given the write is queued on it instead of sent.
+    """
+    from firebase_admin import firestore
+
     data: dict = {
         "status": status,
         "updatedAt": firestore.SERVER_TIMESTAMP,
@@ -60,16 +365,24 @@ def update_run_status(
     if status in ("completed", "failed", "aborted"):
         data["completedAt"] = firestore.SERVER_TIMESTAMP
 
-    db.collection("orgs").document(org_id) \
-        .collection("playbook_runs").document(run_id).update(data)
+    ref = get_run_refs(org_id, run_id).run_doc
+    if buffer is not None:
+        buffer.update(ref, data)
+    else:
+        ref.update(data)
 
 
 def update_run_heartbeat(org_id: str, run_id: str) -> None:
-    """Update the lastHeartbeat timestamp (called every poll cycle by orchestrator)."""
-    db = _get_db()
-    db.collection("orgs").document(org_id) \
-        .collection("playbook_runs").document(run_id) \
-        .update({"lastHeartbeat": firestore.SERVER_TIMESTAMP})
+    """Update the lastHeartbeat timestamp (called every poll cycle by orchestrator).
+
+    Queued on the background writer; heartbeats within one flush window coalesce.
+    """
+    from firebase_admin import firestore
+
+    _writer.update(
+        get_run_refs(org_id, run_id).run_doc,
+        {"lastHeartbeat": firestore.SERVER_TIMESTAMP},
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -86,9 +399,16 @@ def update_step_status(
     error: dict | None = None,
     result_summary: str | None = None,
     job_name: str | None = None,
+    buffer: FirestoreWriteBuffer | None = None,
 ) -> None:
-    """Update a step document status."""
-    db = _get_db()
+    """Update a step document status.
+
+    Queued on the background writer; call flush_writes() before relying on the
+    new status being visible to other readers.  If ``buffer`` is given the
+    write is queued on it instead.
+    """
+    from firebase_admin import firestore
+
     data: dict = {
         "status": status,
     }
@@ -105,28 +425,58 @@ def update_step_status(
     if status in ("completed", "failed", "skipped"):
         data["completedAt"] = firestore.SERVER_TIMESTAMP
 
-    db.collection("orgs").document(org_id) \
-        .collection("playbook_runs").document(run_id) \
-        .collection("steps").document(step_id).update(data)
+    step_ref = get_run_refs(org_id, run_id).step_doc(step_id)
+    if buffer is not None:
+        buffer.update(step_ref, data)
+    else:
+        _writer.update(step_ref, data)
 
 
 def read_step_status(org_id: str, run_id: str, step_id: str) -> str | None:
     """Read a step's current status from Firestore."""
-    db = _get_db()
-    doc = db.collection("orgs").document(org_id) \
-        .collection("playbook_runs").document(run_id) \
-        .collection("steps").document(step_id).get()
+    doc = get_run_refs(org_id, run_id).step_doc(step_id).get()
     if not doc.exists:
         return None
     return (doc.to_dict() or {}).get("status")
 
 
+def read_step_statuses(org_id: str, run_id: str, step_ids) -> dict[str, str | None]:
+    """Read the status of several steps in one get_all RPC (status field only).
+
+    Steps whose doc does not exist map to None.
+    """
+    refs = get_run_refs(org_id, run_id)
+    statuses: dict[str, str | None] = dict.fromkeys(step_ids)
+    for doc in _get_db().get_all([refs.step_doc(sid) for sid in statuses], field_paths=["status"]):
+        if doc.exists:
+            statuses[doc.id] = (doc.to_dict() or {}).get("status")
+    return statuses
+
+
+def watch_step_statuses(
+    org_id: str,
+    run_id: str,
+    on_change: Callable[[str, str | None], None],
+):
+    """Subscribe to status changes on every step doc of a run.
+
+    ``on_change(step_id, status)`` is called from the listener thread for each
+    added or modified step doc (the initial snapshot reports every step).
+    Returns the watch handle; call ``unsubscribe()`` on it when done.
+    """
+    def on_snapshot(_docs, changes, _read_time) -> None:
+        for change in changes:
+            if change.type.name == "REMOVED":
+                continue
+            doc = change.document
+            on_change(doc.id, (doc.to_dict() or {}).get("status"))
+
+    return get_run_refs(org_id, run_id).steps_coll.on_snapshot(on_snapshot)
+
+
 def read_step_doc(org_id: str, run_id: str, step_id: str) -> dict | None:
     """Read the full step document from Firestore."""
-    db = _get_db()
-    doc = db.collection("orgs").document(org_id) \
-        .collection("playbook_runs").document(run_id) \
-        .collection("steps").document(step_id).get()
+    doc = get_run_refs(org_id, run_id).step_doc(step_id).get()
     if not doc.exists:
         return None
     return doc.to_dict()
@@ -147,10 +497,7 @@ def write_prior_reports(
     prior_reports: str,
 ) -> None:
     """Write aggregated prior reports to the step doc (read by context_reader)."""
-    db = _get_db()
-    db.collection("orgs").document(org_id) \
-        .collection("playbook_runs").document(run_id) \
-        .collection("steps").document(step_id) \
+    get_run_refs(org_id, run_id).step_doc(step_id) \
         .update({"priorReports": prior_reports})
 
 
@@ -166,10 +513,7 @@ def write_step_input_request_id(
     request_id: str,
 ) -> None:
     """Store the stepInputRequestId on the step doc for matching."""
-    db = _get_db()
-    db.collection("orgs").document(org_id) \
-        .collection("playbook_runs").document(run_id) \
-        .collection("steps").document(step_id) \
+    get_run_refs(org_id, run_id).step_doc(step_id) \
         .update({"stepInputRequestId": request_id})
 
 
@@ -178,19 +522,19 @@ def read_step_input_response(
     run_id: str,
     step_id: str,
 ) -> dict | None:
-    """Read a step_input_response input doc for a given step."""
-    db = _get_db()
-    inputs_ref = (
-        db.collection("orgs").document(org_id)
-        .collection("playbook_runs").document(run_id)
-        .collection("inputs")
-    )
-    docs = list(
-        inputs_ref.where("stepId", "==", step_id)
-        .where("type", "==", "step_input_response")
+    """Read a step_input_response input doc for a given step.
+
+    Called on every orchestrator tick while a step waits for input, so the
+    common "no response yet" case is answered with a server-side count
+    aggregation; the document body is only fetched once it exists.
+    """
+    query = get_run_refs(org_id, run_id).inputs_coll \
+        .where("stepId", "==", step_id) \
+        .where("type", "==", "step_input_response") \
         .limit(1)
-        .stream()
-    )
+    if not query.count().get()[0][0].value:
+        return None
+    docs = list(query.stream())
     return docs[0].to_dict() if docs else None
 
 
@@ -201,10 +545,7 @@ def write_step_input_values(
     values: dict[str, str],
 ) -> None:
     """Write resolved step input values to the step doc."""
-    db = _get_db()
-    db.collection("orgs").document(org_id) \
-        .collection("playbook_runs").document(run_id) \
-        .collection("steps").document(step_id) \
+    get_run_refs(org_id, run_id).step_doc(step_id) \
         .update({"stepInputValues": values})
 
 
@@ -230,18 +571,29 @@ def write_event(
     *,
     step_id: str | None = None,
     payload: dict | None = None,
+    buffer: FirestoreWriteBuffer | None = None,
 ) -> str:
-    """Append an event to the run's events subcollection. Returns the event ID."""
-    db = _get_db()
+    """Append an event to the run's events subcollection. Returns the event ID.
+
+    If ``buffer`` is given the write is queued on it instead of sent.  Events
+    committed together share the server timestamp, so each one also records
+    ``clientTimestamp`` (orders events across the orchestrator and step agents)
+    and ``clientSeq``, which increases with every event this process writes.
+    """
+    from firebase_admin import firestore
+
     data = {
         "type": event_type,
         "stepId": step_id,
         "timestamp": firestore.SERVER_TIMESTAMP,
+        "clientTimestamp": datetime.now(timezone.utc),
+        "clientSeq": next(_event_seq),
         "payload": payload or {},
     }
-    _, doc_ref = db.collection("orgs").document(org_id) \
-        .collection("playbook_runs").document(run_id) \
-        .collection("events").add(data)
+    events_ref = get_run_refs(org_id, run_id).events_coll
+    if buffer is not None:
+        return buffer.add(events_ref, data)
+    _, doc_ref = events_ref.add(data)
     return doc_ref.id
 
 
@@ -254,21 +606,19 @@ def initialize_step_docs(org_id: str, run_id: str, steps: list) -> None:
     """Create step documents in Firestore with 'pending' status.
 
     Uses .set() so documents are created fresh (not .update() which requires
-    them to already exist).
+    them to already exist).  Writes are grouped into batched commits so a
+    playbook costs ⌈N/500⌉ round-trips instead of N.
     """
+    from firebase_admin import firestore
     from src.playbook_parser import StepDef
 
-    db = _get_db()
-    steps_ref = (
-        db.collection("orgs").document(org_id)
-        .collection("playbook_runs").document(run_id)
-        .collection("steps")
-    )
+    steps_ref = get_run_refs(org_id, run_id).steps_coll
 
+    buffer = FirestoreWriteBuffer()
     for step in steps:
         if not isinstance(step, StepDef):
             continue
-        steps_ref.document(step.id).set({
+        buffer.set(steps_ref.document(step.id), {
             "status": "pending",
             "title": step.title,
             "order": step.order,
@@ -277,6 +627,7 @@ def initialize_step_docs(org_id: str, run_id: str, steps: list) -> None:
             "dependencies": step.dependencies,
             "createdAt": firestore.SERVER_TIMESTAMP,
         })
+    buffer.flush()
 
 
 # ---------------------------------------------------------------------------
@@ -286,14 +637,11 @@ def initialize_step_docs(org_id: str, run_id: str, steps: list) -> None:
 
 def read_context(org_id: str, run_id: str) -> dict:
     """Read the run's hydrated context variables."""
-    run = read_run(org_id, run_id)
-    if run is None:
-        return {}
-    return run.get("context", {})
+    return _read_run_field(org_id, run_id, "context") or {}
 
 
 # ---------------------------------------------------------------------------
-# Input polling (HITL)
+# Input listener (HITL)
 # ---------------------------------------------------------------------------
 
 
@@ -305,34 +653,46 @@ def wait_for_input(
     timeout: int = 300,
     poll_interval: int = 5,
 ) -> dict | None:
-    """Poll the inputs subcollection for a matching response.
+    """Wait for a matching response in the inputs subcollection.
+
+    Subscribes real-time listeners to the matching inputs query and to the run
+    document (for aborts) instead of re-querying on a timer, so a response is
+    seen within one network round-trip.  ``poll_interval`` is accepted for
+    backwards compatibility and ignored.
 
-    Returns the input document dict, or None on timeout.
+    Returns the input document dict, ``{"type": "abort"}`` if the run was
+    aborted, or None on timeout.
     """
-    db = _get_db()
-    inputs_ref = db.collection("orgs").document(org_id) \
-        .collection("playbook_runs").document(run_id) \
-        .collection("inputs")
+    refs = get_run_refs(org_id, run_id)
+    run_ref = refs.run_doc
+    query = refs.inputs_coll \
+        .where("stepId", "==", step_id) \
+        .where("questionId", "==", question_id) \
+        .limit(1)
+
+    done = threading.Event()
+    result: list[dict] = []
 
-    deadline = time.time() + timeout
-    while time.time() < deadline:
-        # Check for abort
-        run = read_run(org_id, run_id)
-        if run and run.get("status") == "aborted":
-            return {"type": "abort"}
+    def on_input(docs, _changes, _read_time) -> None:
+        if docs and not done.is_set():
+            result.append(docs[0].to_dict())
+            done.set()
 
-        # Check for matching input
-        query = inputs_ref \
-            .where("stepId", "==", step_id) \
-            .where("questionId", "==", question_id) \
-            .limit(1)
-        docs = list(query.stream())
-        if docs:
-            return docs[0].to_dict()
+    def on_run(docs, _changes, _read_time) -> None:
+        for doc in docs:
+            if (doc.to_dict() or {}).get("status") == "aborted" and not done.is_set():
+                result.append({"type": "abort"})
+                done.set()
 
-        time.sleep(poll_interval)
+    input_watch = query.on_snapshot(on_input)
+    run_watch = run_ref.on_snapshot(on_run)
+    try:
+        done.wait(timeout)
+    finally:
+        input_watch.unsubscribe()
+        run_watch.unsubscribe()
 
-    return None
+    return result[0] if result else None
 
 
 # ---------------------------------------------------------------------------
@@ -372,8 +732,7 @@ def fetch_role_members(org_id: str, role: str) -> list[dict]:
 
 def read_role_assignments(org_id: str, run_id: str) -> dict[str, dict]:
     """Read roleAssignments from the run document."""
-    run = read_run(org_id, run_id)
-    return (run or {}).get("roleAssignments", {})
+    return _read_run_field(org_id, run_id, "roleAssignments") or {}
 
 
 def check_token_exists(org_id: str, uid: str, service: str) -> bool:
@@ -387,10 +746,7 @@ def check_token_exists(org_id: str, uid: str, service: str) -> bool:
 
 def fetch_trigger_inputs(org_id: str, run_id: str) -> dict:
     """Read the triggerInputs from the run document."""
-    run = read_run(org_id, run_id)
-    if run is None:
-        return {}
-    return run.get("triggerInputs", {})
+    return _read_run_field(org_id, run_id, "triggerInputs") or {}
 
 
 def build_hydration_context(
@@ -410,30 +766,43 @@ def build_hydration_context(
     """
     from src.playbook_parser import VariableDef
 
-    # Determine which source prefixes are needed
-    sources = {v.source for v in variables if isinstance(v, VariableDef)}
-    needs_org = any(s.startswith("org.") for s in sources)
-    needs_run = any(s.startswith("run.") for s in sources)
+    # Determine which source prefixes are needed (single pass over sources)
+    needs_org = needs_run = False
     # Collect distinct roles needed from members.{role}.* sources
     member_roles: set[str] = set()
-    for s in sources:
-        if s.startswith("members."):
-            parts = s.split(".", 2)
-            if len(parts) >= 2:
-                member_roles.add(parts[1])
-
+    for v in variables:
+        if not isinstance(v, VariableDef):
+            continue
+        head, sep, rest = v.source.partition(".")
+        if not sep:
+            continue
+        if head == "org":
+            needs_org = True
+        elif head == "run":
+            needs_run = True
+        elif head == "members":
+            member_roles.add(rest.partition(".")[0])
+
+    # Each source is an independent Firestore RPC — issue them concurrently
+    # (the gRPC client is thread-safe) so latency is max() rather than sum().
     context: dict = {}
+    with ThreadPoolExecutor(max_workers=2 + len(member_roles)) as pool:
+        org_future = pool.submit(fetch_org_context, org_id) if needs_org else None
+        run_future = pool.submit(fetch_trigger_inputs, org_id, run_id) if needs_run else None
+        member_futures = {
+            role: pool.submit(fetch_role_members, org_id, role)
+            for role in member_roles
+        }
 
-    if needs_org:
-        context["org"] = fetch_org_context(org_id)
+        if org_future is not None:
+            context["org"] = org_future.result()
 
-    if needs_run:
-        context["run"] = {"context": fetch_trigger_inputs(org_id, run_id)}
+        if run_future is not None:
+            context["run"] = {"context": run_future.result()}
 
-    if member_roles:
-        members_ctx: dict[str, list[dict]] = {}
-        for role in member_roles:
-            members_ctx[role] = fetch_role_members(org_id, role)
-        context["members"] = members_ctx
+        if member_futures:
+            context["members"] = {
+                role: future.result() for role, future in member_futures.items()
+            }
 
     return context
@@ -7,15 +7,33 @@ Writes the hydrated result to /shared/PLAYBOOK_HYDRATED.md.
 
 from __future__ import annotations
 
+import functools
 import os
 import re
-from typing import Any
+from collections.abc import Callable
+from typing import Any, BinaryIO
 
 from src.playbook_parser import PlaybookDefinition, VariableDef
 
+# RE2 (google-re2) matches in linear time with a DFA; it is optional and the
+# stdlib engine is used when it isn't installed.
+try:
+    import re2 as _re_impl
+except ImportError:
+    _re_impl = re
 
-# Match {{variable_name}} with optional whitespace inside braces
-_VAR_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+# Python's Unicode \s as an explicit class: RE2's \s is ASCII-only, so spelling
+# the characters out keeps matching identical whichever engine is in use.
+# (U+3000 is the highest code point str.isspace() accepts.)
+_WHITESPACE = "[" + "".join(c for c in map(chr, range(0x3001)) if c.isspace()) + "]"
+
+# Output is streamed segment by segment through a buffer sized for
+# multi-MB playbooks on the shared volume.
+_WRITE_BUFFER_SIZE = 2 * 1024 * 1024
+
+# Directories already created by this process (skips repeat makedirs stats)
+_created_dirs: set[str] = set()
 
 
 # ---------------------------------------------------------------------------
@@ -23,21 +41,93 @@ _VAR_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
 # ---------------------------------------------------------------------------
 
 
-def _resolve_dot_path(context: dict, path: str) -> Any:
-    """Traverse a nested dict using a dot-separated path.
+@functools.lru_cache(maxsize=1024)
+def _split_path(path: str) -> tuple[str, ...]:
+    return tuple(path.split("."))
+
+
+def _walk(current: Any, segments: tuple[str, ...]) -> Any:
+    # Missing keys and non-dict intermediates (including None) raise, which
+    # keeps per-segment checks off the common success path.
+    try:
+        for segment in segments:
+            current = current[segment]
+    except (KeyError, TypeError):
+        return None
+    return current
+
+
+def _resolve_dot_path(
+    context: dict,
+    segments: tuple[str, ...],
+    subtree_cache: dict[tuple[str, ...], Any] | None = None,
+) -> Any:
+    """Traverse a nested dict along a pre-split dot path.
 
-    Example: _resolve_dot_path({"org": {"name": "Acme"}}, "org.name") -> "Acme"
+    Example: _resolve_dot_path({"org": {"name": "Acme"}}, ("org", "name")) -> "Acme"
     Returns None if any segment is missing.
+
+    If ``subtree_cache`` is given, the node at the path's parent prefix is
+    memoized in it, so sibling paths (``org.name``, ``org.domain``) walk the
+    shared prefix only once.
     """
-    current: Any = context
-    for segment in path.split("."):
-        if isinstance(current, dict):
-            current = current.get(segment)
-        else:
-            return None
-        if current is None:
-            return None
-    return current
+    if subtree_cache is None:
+        return _walk(context, segments)
+
+    parent = segments[:-1]
+    if parent in subtree_cache:
+        current = subtree_cache[parent]
+    else:
+        current = subtree_cache[parent] = _walk(context, parent)
+    return _walk(current, segments[-1:])
+
+
+def _stringify(value: Any) -> str:
+    """Convert a resolved value to its template string representation."""
+    if isinstance(value, list):
+        # For member lists, join emails/names (falls back past empty emails)
+        return ", ".join(
+            (item.get("email") or item.get("displayName") or str(item))
+            if isinstance(item, dict) else str(item)
+            for item in value
+        )
+    return str(value)
+
+
+def compile_resolver(
+    variables: list[VariableDef],
+) -> Callable[[dict], dict[str, str]]:
+    """Build a resolver for a fixed variable list.
+
+    Source paths are split once here; the returned function only walks the
+    context.  hydrate_playbook() caches it on ``PlaybookDefinition.resolver``
+    so repeated hydrations of the same playbook skip this step.
+    """
+    plan = [
+        (var.name, var.source, _split_path(var.source) if var.source else (), var.required)
+        for var in variables
+    ]
+
+    def resolve(context: dict) -> dict[str, str]:
+        resolved: dict[str, str] = {}
+        subtree_cache: dict[tuple[str, ...], Any] = {}
+
+        for name, source, segments, required in plan:
+            value = _resolve_dot_path(context, segments, subtree_cache) if segments else None
+
+            if value is None:
+                if required:
+                    raise ValueError(
+                        f"Required variable '{name}' could not be resolved "
+                        f"(source: '{source}')"
+                    )
+                continue
+
+            resolved[name] = _stringify(value)
+
+        return resolved
+
+    return resolve
 
 
 def resolve_variables(
@@ -49,35 +139,7 @@ def resolve_variables(
     Returns a flat dict of {variable_name: resolved_value_as_string}.
     Raises ValueError for required variables that can't be resolved.
     """
-    resolved: dict[str, str] = {}
-
-    for var in variables:
-        value = _resolve_dot_path(context, var.source) if var.source else None
-
-        if value is None:
-            if var.required:
-                raise ValueError(
-                    f"Required variable '{var.name}' could not be resolved "
-                    f"(source: '{var.source}')"
-                )
-            continue
-
-        # Convert to string representation
-        if isinstance(value, list):
-            # For member lists, join emails/names
-            parts = []
-            for item in value:
-                if isinstance(item, dict):
-                    parts.append(item.get("email", item.get("displayName", str(item))))
-                else:
-                    parts.append(str(item))
-            resolved[var.name] = ", ".join(parts)
-        elif isinstance(value, dict):
-            resolved[var.name] = str(value)
-        else:
-            resolved[var.name] = str(value)
-
-    return resolved
+    return compile_resolver(variables)(context)
 
 
 # ---------------------------------------------------------------------------
@@ -85,16 +147,59 @@ def resolve_variables(
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=128)
+def _compiled_for(keys: frozenset[str]) -> Any:
+    """Compile a placeholder pattern matching only the given variable names.
+
+    Matches ``{{name}}`` with optional whitespace inside the braces.  Names
+    that aren't all (Unicode) word characters are excluded.  Returns an ``re``
+    or ``re2`` pattern, or None if no name qualifies.  The pattern uses no
+    ``\w``/``\s`` classes — names are escaped literals and whitespace is
+    ``_WHITESPACE`` — so both engines match exactly the same text.
+    """
+    names = [k for k in keys if re.fullmatch(r"\w+", k)]
+    if not names:
+        return None
+    return _re_impl.compile(
+        r"\{\{" + _WHITESPACE + "*(" + "|".join(map(re.escape, sorted(names))) + ")"
+        + _WHITESPACE + r"*\}\}"
+    )
+
+
 def hydrate_template(content: str, resolved: dict[str, str]) -> str:
     """Replace all {{variable_name}} occurrences in content with resolved values.
 
     Unresolved placeholders are left as-is (they may be optional or for later use).
+    The pattern only matches resolved names, so every match is a guaranteed
+    dict hit and unknown placeholders never reach the replacement callback.
+    """
+    if not resolved or "{{" not in content:
+        return content
+
+    pattern = _compiled_for(frozenset(resolved))
+    if pattern is None:
+        return content
+    return pattern.sub(lambda m: resolved[m.group(1)], content)
+
+
+def hydrate_to_stream(content: str, resolved: dict[str, str], f: BinaryIO) -> None:
+    """Write content to a binary stream with placeholders substituted.
+
+    Same substitution rules as hydrate_template(), but literal segments and
+    values are written as they are matched, so the hydrated body is never
+    held in memory as a second full-size string.
     """
-    def replacer(match: re.Match) -> str:
-        var_name = match.group(1)
-        return resolved.get(var_name, match.group(0))
+    pattern = _compiled_for(frozenset(resolved)) if resolved and "{{" in content else None
+    if pattern is None:
+        f.write(content.encode("utf-8"))
+        return
 
-    return _VAR_RE.sub(replacer, content)
+    pos = 0
+    for m in pattern.finditer(content):
+        f.write(content[pos:m.start()].encode("utf-8"))
+        f.write(resolved[m.group(1)].encode("utf-8"))
+        pos = m.end()
+    f.write(content[pos:].encode("utf-8"))
 
 
 # ---------------------------------------------------------------------------
@@ -111,14 +216,17 @@ def hydrate_playbook(
 
     Returns the resolved variables dict.
     """
-    resolved = resolve_variables(playbook.variables, context)
-
-    hydrated_body = hydrate_template(playbook.markdown_body, resolved)
+    if playbook.resolver is None:
+        playbook.resolver = compile_resolver(playbook.variables)
+    resolved = playbook.resolver(context)
 
     # Ensure output directory exists
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    output_dir = os.path.dirname(output_path)
+    if output_dir not in _created_dirs:
+        os.makedirs(output_dir, exist_ok=True)
+        _created_dirs.add(output_dir)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(hydrated_body)
+    with open(output_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        hydrate_to_stream(playbook.markdown_body, resolved, f)
 
     return resolved
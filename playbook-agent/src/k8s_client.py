@@ -12,32 +12,29 @@ AGENT_IMAGE_REGISTRY env var, set by the Firebase Function that launched us.
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import os
+import threading
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
 
-from kubernetes import client, config
+from kubernetes import client, config, watch
 
 # ---------------------------------------------------------------------------
 # Initialisation
 # ---------------------------------------------------------------------------
 
-_api_batch: client.BatchV1Api | None = None
-_api_core: client.CoreV1Api | None = None
-
-
-def _init_clients() -> None:
-    global _api_batch, _api_core
-    if _api_batch is not None:
-        return
+@functools.lru_cache(maxsize=1)
+def _clients() -> tuple[client.BatchV1Api, client.CoreV1Api]:
+    """Load in-cluster config once and return the (batch, core) API clients."""
     config.load_incluster_config()
-    _api_batch = client.BatchV1Api()
-    _api_core = client.CoreV1Api()
+    return client.BatchV1Api(), client.CoreV1Api()
 
 
-def _namespace() -> str:
-    return os.environ.get("NAMESPACE", "skillmatic")
+# Env is fixed for the lifetime of the pod, so resolve the namespace once
+_NAMESPACE = os.environ.get("NAMESPACE", "skillmatic")
 
 
 def _k8s_name(name: str) -> str:
@@ -45,11 +42,27 @@ def _k8s_name(name: str) -> str:
     return name.lower()
 
 
+def _job_name(run_name: str, step_name: str) -> str:
+    """Build a Job name from already-sanitised run and step names.
+
+    The name is ``step-{run}-{step}``.  Names over the 63-char limit keep the
+    first 54 characters plus ``-`` and an 8-hex-digit blake2b digest of the
+    full name, so long IDs that share a prefix don't collide.  Don't rebuild
+    the name elsewhere: the orchestrator stores it as ``jobName`` on the step
+    doc, and Jobs also carry ``run-id``/``step-id`` labels for selection.
+    """
+    base = f"step-{run_name}-{step_name}"
+    if len(base) <= 63:
+        return base
+    return base[:54] + "-" + hashlib.blake2b(base.encode(), digest_size=4).hexdigest()
+
+
 # ---------------------------------------------------------------------------
 # Image resolution
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=64)
 def resolve_image(agent_image: str) -> str:
     """Resolve a step's agentImage to a full container image reference.
 
@@ -57,6 +70,8 @@ def resolve_image(agent_image: str) -> str:
     Otherwise prepend the AGENT_IMAGE_REGISTRY env var.
     Short name "echo" → "{registry}/step-echo:latest"
     API agent "api-agent-notion" → "{registry}/api-agent-notion:latest"
+
+    Results are cached; the registry env var is constant for the pod's lifetime.
     """
     if "/" in agent_image:
         return agent_image
@@ -77,7 +92,7 @@ def resolve_image(agent_image: str) -> str:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JobResult:
     succeeded: bool
     job_name: str
@@ -101,70 +116,73 @@ def create_step_job(
 ) -> str:
     """Create a K8s Job for a step agent.
 
-    Returns the Job name.
+    Returns the Job name (see _job_name); callers record it on the step doc.
     """
-    _init_clients()
-    job_name = f"step-{_k8s_name(run_id)}-{_k8s_name(step_id)}"[:63]
-
-    env_vars = [
-        client.V1EnvVar(name="RUN_ID", value=run_id),
-        client.V1EnvVar(name="ORG_ID", value=org_id),
-        client.V1EnvVar(name="STEP_ID", value=step_id),
-        client.V1EnvVar(name="NAMESPACE", value=_namespace()),
-    ]
-    for k, v in (env_extras or {}).items():
-        env_vars.append(client.V1EnvVar(name=k, value=v))
+    api_batch, _ = _clients()
+    run_name = _k8s_name(run_id)
+    step_name = _k8s_name(step_id)
+    job_name = _job_name(run_name, step_name)
+
+    base = (
+        ("RUN_ID", run_id),
+        ("ORG_ID", org_id),
+        ("STEP_ID", step_id),
+        ("NAMESPACE", _NAMESPACE),
+    )
+    items = [*base, *(env_extras or {}).items()]
+    env_vars = [{"name": k, "value": v} for k, v in items]
 
     labels = {
         "app": "skillmatic",
-        "run-id": _k8s_name(run_id),
-        "step-id": _k8s_name(step_id),
+        "run-id": run_name,
+        "step-id": step_name,
         "component": "step-agent",
     }
 
-    container = client.V1Container(
-        name="step-agent",
-        image=image,
-        env=env_vars,
-        resources=client.V1ResourceRequirements(
-            requests={"cpu": "250m", "memory": "512Mi"},
-            limits={"cpu": "1", "memory": "1Gi"},
-        ),
-        volume_mounts=[
-            client.V1VolumeMount(name="scratch", mount_path="/shared"),
+    # Plain-dict manifest: the API client serialises dicts as-is, skipping
+    # the per-attribute validation of the generated V1* models.
+    container = {
+        "name": "step-agent",
+        "image": image,
+        "env": env_vars,
+        "resources": {
+            "requests": {"cpu": "250m", "memory": "512Mi"},
+            "limits": {"cpu": "1", "memory": "1Gi"},
+        },
+        "volumeMounts": [
+            {"name": "scratch", "mountPath": "/shared"},
         ],
-    )
+    }
 
-    pod_spec = client.V1PodSpec(
-        service_account_name=service_account,
-        restart_policy="Never",
-        containers=[container],
-        volumes=[
-            client.V1Volume(
-                name="scratch",
-                empty_dir=client.V1EmptyDirVolumeSource(),
-            ),
+    pod_spec = {
+        "serviceAccountName": service_account,
+        "restartPolicy": "Never",
+        "containers": [container],
+        "volumes": [
+            {"name": "scratch", "emptyDir": {}},
         ],
-    )
+    }
 
-    job = client.V1Job(
-        metadata=client.V1ObjectMeta(
-            name=job_name,
-            namespace=_namespace(),
-            labels=labels,
-        ),
-        spec=client.V1JobSpec(
-            backoff_limit=0,
-            active_deadline_seconds=timeout_minutes * 60,
-            ttl_seconds_after_finished=300,
-            template=client.V1PodTemplateSpec(
-                metadata=client.V1ObjectMeta(labels=labels),
-                spec=pod_spec,
-            ),
-        ),
-    )
+    job = {
+        "apiVersion": "batch/v1",
+        "kind": "Job",
+        "metadata": {
+            "name": job_name,
+            "namespace": _NAMESPACE,
+            "labels": labels,
+        },
+        "spec": {
+            "backoffLimit": 0,
+            "activeDeadlineSeconds": timeout_minutes * 60,
+            "ttlSecondsAfterFinished": 300,
+            "template": {
+                "metadata": {"labels": labels},
+                "spec": pod_spec,
+            },
+        },
+    }
 
-    _api_batch.create_namespaced_job(namespace=_namespace(), body=job)
+    api_batch.create_namespaced_job(namespace=_NAMESPACE, body=job)
     return job_name
 
 
@@ -173,51 +191,139 @@ def create_step_job(
 # ---------------------------------------------------------------------------
 
 
+def _job_result(job_name: str, status: client.V1JobStatus | None) -> JobResult | None:
+    """Map a Job status to a terminal JobResult, or None while it is still running."""
+    if status is None:
+        return None
+
+    if status.succeeded and status.succeeded >= 1:
+        return JobResult(
+            succeeded=True,
+            job_name=job_name,
+            message="Job completed successfully",
+        )
+
+    if status.failed and status.failed >= 1:
+        reason = "Job failed"
+        if status.conditions:
+            for cond in status.conditions:
+                if cond.type == "Failed":
+                    reason = cond.message or cond.reason or reason
+                    break
+        return JobResult(
+            succeeded=False,
+            job_name=job_name,
+            message=reason,
+        )
+
+    return None
+
+
+def _poll_for_job(
+    api_batch: client.BatchV1Api,
+    stop: threading.Event,
+    job_name: str,
+    deadline: float,
+    poll_interval: float,
+) -> JobResult | None:
+    """Poll a Job with exponential backoff until it finishes or the deadline passes.
+
+    Starts at 0.5s so short jobs are noticed quickly, and grows by 1.5x up to
+    ``poll_interval`` so long jobs don't hammer the API server.  Returns None
+    early once ``stop`` is set.
+    """
+    interval = 0.5
+    while time.time() < deadline:
+        job = api_batch.read_namespaced_job(name=job_name, namespace=_NAMESPACE)
+        result = _job_result(job_name, job.status)
+        if result is not None:
+            return result
+        if stop.wait(interval):
+            return None
+        interval = min(interval * 1.5, poll_interval)
+    return None
+
+
+def _watch_job(
+    api_batch: client.BatchV1Api,
+    w: watch.Watch,
+    stop: threading.Event,
+    job_name: str,
+    deadline: float,
+    poll_interval: int,
+) -> JobResult | None:
+    """Stream a Job's status until it is terminal.
+
+    Returns None if the deadline passes or ``stop`` is set first.
+    """
+    try:
+        # The server may close a watch early; re-open it until the deadline.
+        # Watch.stream() clears w.stop(), so ``stop`` is what ends this loop.
+        while not stop.is_set() and (remaining := int(deadline - time.time())) > 0:
+            for event in w.stream(
+                api_batch.list_namespaced_job,
+                namespace=_NAMESPACE,
+                field_selector=f"metadata.name={job_name}",
+                timeout_seconds=remaining,
+            ):
+                if stop.is_set():
+                    return None
+                result = _job_result(job_name, event["object"].status)
+                if result is not None:
+                    return result
+    except client.ApiException:
+        # Watch not permitted or unavailable — fall back to polling
+        return _poll_for_job(api_batch, stop, job_name, deadline, poll_interval)
+    return None
+
+
 def wait_for_job(
     job_name: str,
     timeout_seconds: int = 1800,
     poll_interval: int = 10,
     on_poll: Callable[[], None] | None = None,
 ) -> JobResult:
-    """Poll a K8s Job until it succeeds, fails, or times out.
+    """Watch a K8s Job until it succeeds, fails, or times out.
+
+    Status changes are pushed over a watch stream instead of being polled,
+    so completion is seen as soon as the API server reports it.
 
     Args:
-        on_poll: Optional callback invoked on each poll iteration (e.g. to
-                 check Firestore step status for paused detection).
+        on_poll: Optional callback invoked every ``poll_interval`` seconds
+                 while waiting (e.g. to check Firestore step status for
+                 paused detection).  It runs on the calling thread, so an
+                 exception it raises stops the wait and propagates.
     """
-    _init_clients()
+    api_batch, _ = _clients()
     deadline = time.time() + timeout_seconds
 
-    while time.time() < deadline:
-        job = _api_batch.read_namespaced_job(
-            name=job_name, namespace=_namespace(),
-        )
-        status = job.status
-
-        if status.succeeded and status.succeeded >= 1:
-            return JobResult(
-                succeeded=True,
-                job_name=job_name,
-                message="Job completed successfully",
-            )
-
-        if status.failed and status.failed >= 1:
-            reason = "Job failed"
-            if status.conditions:
-                for cond in status.conditions:
-                    if cond.type == "Failed":
-                        reason = cond.message or cond.reason or reason
-                        break
-            return JobResult(
-                succeeded=False,
-                job_name=job_name,
-                message=reason,
-            )
-
-        if on_poll is not None:
+    # The watch runs on a worker thread; the caller's thread drives on_poll
+    w = watch.Watch()
+    stop = threading.Event()
+    done = threading.Event()
+    outcome: list[JobResult | Exception | None] = []
+
+    def _run_watch() -> None:
+        try:
+            outcome.append(_watch_job(api_batch, w, stop, job_name, deadline, poll_interval))
+        except Exception as exc:
+            outcome.append(exc)
+        finally:
+            done.set()
+
+    threading.Thread(target=_run_watch, name=f"watch-{job_name}", daemon=True).start()
+    try:
+        while not done.wait(poll_interval if on_poll is not None else None):
             on_poll()
+    finally:
+        stop.set()
+        w.stop()
 
-        time.sleep(poll_interval)
+    result = outcome[0]
+    if isinstance(result, Exception):
+        raise result
+    if result is not None:
+        return result
 
     return JobResult(
         succeeded=False,
@@ -233,11 +339,11 @@ def wait_for_job(
 
 def delete_job(job_name: str) -> None:
     """Delete a Job and its pods (best-effort)."""
-    _init_clients()
+    api_batch, _ = _clients()
     try:
-        _api_batch.delete_namespaced_job(
+        api_batch.delete_namespaced_job(
             name=job_name,
-            namespace=_namespace(),
+            namespace=_NAMESPACE,
             propagation_policy="Foreground",
         )
     except client.ApiException as exc:
@@ -247,11 +353,11 @@ def delete_job(job_name: str) -> None:
 
 def delete_configmap(name: str) -> None:
     """Delete a ConfigMap (best-effort)."""
-    _init_clients()
+    _, api_core = _clients()
     try:
-        _api_core.delete_namespaced_config_map(
+        api_core.delete_namespaced_config_map(
             name=name,
-            namespace=_namespace(),
+            namespace=_NAMESPACE,
         )
     except client.ApiException as exc:
         if exc.status != 404:
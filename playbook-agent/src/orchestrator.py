@@ -21,28 +21,37 @@ chains.  Steps with no dependencies launch immediately in parallel.
 
 from __future__ import annotations
 
+import heapq
+import logging
 import os
+import queue
+import sys
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 from src.dag_scheduler import (
-    get_ready_steps,
+    DagIndex,
+    ReadyQueue,
     get_transitive_dependents,
     validate_dag,
 )
 from src.firestore_client import (
+    FirestoreWriteBuffer,
     check_token_exists,
     fetch_role_members,
+    flush_writes,
     initialize_step_docs,
     read_role_assignments,
-    read_run,
+    read_run_status,
     read_step_input_response,
     read_step_input_values,
     read_step_report,
-    read_step_status,
+    read_step_statuses,
     update_run_heartbeat,
     update_run_status,
     update_step_status,
+    watch_step_statuses,
     write_event,
     write_prior_reports,
     write_step_input_request_id,
@@ -52,7 +61,10 @@ from src.k8s_client import create_step_job, resolve_image
 from src.playbook_parser import PlaybookDefinition, StepDef
 
 SHARED_ROOT = "/shared"
-DEFAULT_POLL_INTERVAL = 10  # seconds
+DEFAULT_POLL_INTERVAL = 10  # seconds — upper bound between loop passes
+MAX_PARALLEL_LAUNCHES = 16  # concurrent launches per wave of ready steps
+
+log = logging.getLogger("orchestrator")
 
 
 class StepFailedError(Exception):
@@ -72,16 +84,27 @@ class RunAbortedError(Exception):
 # ---------------------------------------------------------------------------
 
 
+def _report_path(step_id: str) -> str:
+    return os.path.join(SHARED_ROOT, "results", step_id, "report.md")
+
+
 def _read_step_report_local(step_id: str) -> str | None:
     """Read a step's completion report from the shared volume (best-effort)."""
-    path = os.path.join(SHARED_ROOT, "results", step_id, "report.md")
     try:
-        with open(path, "r", encoding="utf-8") as f:
+        with open(_report_path(step_id), "r", encoding="utf-8") as f:
             return f.read()
     except FileNotFoundError:
         return None
 
 
+def _report_size(step_id: str) -> int | None:
+    """Size in bytes of a step's report on the shared volume, without reading it."""
+    try:
+        return os.stat(_report_path(step_id)).st_size
+    except FileNotFoundError:
+        return None
+
+
 def _collect_prior_reports(
     step: StepDef,
     step_map: dict[str, StepDef],
@@ -150,7 +173,7 @@ def _check_oauth_and_launch(
     else:
         members = fetch_role_members(org_id, role) if role else []
         if not members:
-            print(f"[orchestrator] No member with role '{role}' — launching anyway")
+            log.info("No member with role '%s' — launching anyway", role)
             if not _check_step_inputs(step, org_id, run_id, input_notified):
                 return "waiting_input"
             _launch_step(step, org_id, run_id, namespace, prior_reports=prior_reports)
@@ -159,7 +182,7 @@ def _check_oauth_and_launch(
         target_name = members[0].get("displayName", members[0].get("email", "User"))
 
     if not target_uid:
-        print(f"[orchestrator] Member has no uid — launching anyway")
+        log.info("Member has no uid — launching anyway")
         if not _check_step_inputs(step, org_id, run_id, input_notified):
             return "waiting_input"
         _launch_step(step, org_id, run_id, namespace, prior_reports=prior_reports)
@@ -169,7 +192,7 @@ def _check_oauth_and_launch(
     has_token = check_token_exists(org_id, target_uid, step.api)
 
     if has_token:
-        print(f"[orchestrator] OAuth token found for {target_name} / {step.api}")
+        log.info("OAuth token found for %s / %s", target_name, step.api)
         # OAuth ok — now check step inputs before launching
         if not _check_step_inputs(step, org_id, run_id, input_notified):
             return "waiting_input"
@@ -192,7 +215,7 @@ def _check_oauth_and_launch(
             },
         )
         update_step_status(org_id, run_id, step.id, "waiting_for_oauth")
-        print(f"[orchestrator] Step {step.id} -> waiting_for_oauth ({target_name} / {step.api})")
+        log.info("Step %s -> waiting_for_oauth (%s / %s)", step.id, target_name, step.api)
 
     return "waiting_oauth"
 
@@ -246,7 +269,7 @@ def _check_step_inputs(
         )
         update_step_status(org_id, run_id, step.id, "waiting_for_input")
         write_step_input_request_id(org_id, run_id, step.id, request_id)
-        print(f"[orchestrator] Step {step.id} -> waiting_for_input ({len(step.inputs)} input(s) requested)")
+        log.info("Step %s -> waiting_for_input (%s input(s) requested)", step.id, len(step.inputs))
 
     return False
 
@@ -275,22 +298,27 @@ def _launch_step(
     """
     step_id = step.id
 
-    update_step_status(org_id, run_id, step_id, "running")
+    # Committed before any other write to the step doc: the listener snapshot
+    # that write triggers must already say "running", or the loop would see
+    # the stale "ready" and launch the step a second time.
+    started = FirestoreWriteBuffer()
+    update_step_status(org_id, run_id, step_id, "running", buffer=started)
+    started.flush()
 
     # Write prior reports to step doc for the agent to consume
     if prior_reports:
         write_prior_reports(org_id, run_id, step_id, prior_reports)
-        print(f"[orchestrator] Injected {len(prior_reports)} chars of prior reports for {step_id}")
+        log.info("Injected %s chars of prior reports for %s", len(prior_reports), step_id)
 
     write_event(
         org_id, run_id, "step_started",
         step_id=step_id,
         payload={"stepId": step_id, "title": step.title},
     )
-    print(f"[orchestrator] Step {step_id} ({step.title}) -> running")
+    log.info("Step %s (%s) -> running", step_id, step.title)
 
     image = resolve_image(step.agent_image)
-    print(f"[orchestrator] Image: {image}")
+    log.info("Image: %s", image)
 
     job_name = create_step_job(
         run_id=run_id,
@@ -299,8 +327,12 @@ def _launch_step(
         org_id=org_id,
         timeout_minutes=step.timeout_minutes,
     )
-    update_step_status(org_id, run_id, step_id, "running", job_name=job_name)
-    print(f"[orchestrator] Created Job: {job_name}")
+    # jobName is the only record of the (possibly hashed) name outside K8s, so
+    # it is committed now rather than left on the background writer.
+    launched = FirestoreWriteBuffer()
+    update_step_status(org_id, run_id, step_id, "running", job_name=job_name, buffer=launched)
+    launched.flush()
+    log.info("Created Job: %s", job_name)
     return job_name
 
 
@@ -313,18 +345,18 @@ def _poll_step_once(
     org_id: str,
     run_id: str,
     step_id: str,
+    status: str | None,
     paused_notified: dict[str, bool],
 ) -> str | None:
-    """Check a single step's Firestore status once.
+    """Evaluate a single step's latest Firestore status.
 
+    ``status`` is the most recent value reported by the step status listener.
     Returns the status string if terminal ("completed", "failed", "skipped"),
     or None if the step is still in-progress (running/paused/pending).
 
     Handles paused/resumed notification side-effects.
     The ``paused_notified`` dict is mutated in-place for tracking.
     """
-    status = read_step_status(org_id, run_id, step_id)
-
     if status in ("completed", "failed", "skipped"):
         return status
 
@@ -335,7 +367,7 @@ def _poll_step_once(
             step_id=step_id,
             payload={"message": "Waiting for user input (pod terminated, checkpoint saved)"},
         )
-        print(f"[orchestrator] Step {step_id} is paused — waiting for user input")
+        log.info("Step %s is paused — waiting for user input", step_id)
 
     if status == "running" and paused_notified.get(step_id, False):
         paused_notified[step_id] = False
@@ -344,7 +376,7 @@ def _poll_step_once(
             step_id=step_id,
             payload={"message": "Step resumed after user input"},
         )
-        print(f"[orchestrator] Step {step_id} resumed from pause")
+        log.info("Step %s resumed from pause", step_id)
 
     # waiting_for_oauth → ready transition: token was granted, re-launch needed
     if status == "ready":
@@ -353,6 +385,45 @@ def _poll_step_once(
     return None  # still in progress
 
 
+def _wait_for_status_changes(
+    events: queue.Queue,
+    statuses: dict[str, str | None],
+    timeout: float,
+) -> bool:
+    """Block until a step status change arrives or ``timeout`` elapses.
+
+    Every change already queued is applied to ``statuses`` so one wakeup
+    handles a burst of updates.  Returns False if nothing arrived.
+    """
+    try:
+        step_id, status = events.get(timeout=max(timeout, 0))
+    except queue.Empty:
+        return False
+    statuses[step_id] = status
+    while True:
+        try:
+            step_id, status = events.get_nowait()
+        except queue.Empty:
+            return True
+        statuses[step_id] = status
+
+
+def _arm_deadline(
+    step: StepDef,
+    started_at: float,
+    step_deadlines: dict[str, float],
+    deadline_heap: list[tuple[float, str]],
+) -> None:
+    """Record a (re)launched step's timeout deadline on the ``time.monotonic()`` clock.
+
+    Older heap entries for the same step stay in the heap and are discarded
+    when popped, because they no longer match ``step_deadlines``.
+    """
+    deadline = started_at + step.timeout_minutes * 60
+    step_deadlines[step.id] = deadline
+    heapq.heappush(deadline_heap, (deadline, step.id))
+
+
 # ---------------------------------------------------------------------------
 # Step completion handler
 # ---------------------------------------------------------------------------
@@ -368,14 +439,17 @@ def _handle_step_completion(
     step_id = step.id
 
     if final_status == "completed":
-        # Read report: prefer Firestore (written by API agent), fall back to local
-        report = read_step_report(org_id, run_id, step_id) or _read_step_report_local(step_id)
-        summary = (
-            f"Step completed. Report: {len(report)} chars"
-            if report
-            else "Step completed (no report)."
-        )
-        has_report = report is not None and len(report) > 0
+        # Report size: prefer Firestore (written by API agent), fall back to a
+        # stat of the local file — only the size is needed here.
+        report = read_step_report(org_id, run_id, step_id)
+        has_report = True
+        if report:
+            summary = f"Step completed. Report: {len(report)} chars"
+        elif size := _report_size(step_id):
+            summary = f"Step completed. Report: {size} bytes"
+        else:
+            summary = "Step completed (no report)."
+            has_report = False
         update_step_status(
             org_id, run_id, step_id, "completed",
             result_summary=summary,
@@ -389,7 +463,7 @@ def _handle_step_completion(
                 "hasReport": has_report,
             },
         )
-        print(f"[orchestrator] Step {step_id} completed: {summary}")
+        log.info("Step %s completed: %s", step_id, summary)
 
     elif final_status == "failed":
         error_msg = f"Step {step_id} failed (detected via Firestore status)"
@@ -402,10 +476,10 @@ def _handle_step_completion(
             step_id=step_id,
             payload={"stepId": step_id, "error": error_msg},
         )
-        print(f"[orchestrator] Step {step_id} FAILED")
+        log.info("Step %s FAILED", step_id)
 
     elif final_status == "skipped":
-        print(f"[orchestrator] Step {step_id} was skipped")
+        log.info("Step %s was skipped", step_id)
 
 
 # ---------------------------------------------------------------------------
@@ -413,9 +487,23 @@ def _handle_step_completion(
 # ---------------------------------------------------------------------------
 
 
+def _batch_skip(org_id: str, run_id: str, step_ids: set[str], reason: str) -> None:
+    """Mark steps skipped and write a progress event for each in batched commits."""
+    buffer = FirestoreWriteBuffer()
+    for skip_id in step_ids:
+        update_step_status(org_id, run_id, skip_id, "skipped", buffer=buffer)
+        write_event(
+            org_id, run_id, "progress",
+            step_id=skip_id,
+            payload={"message": reason},
+            buffer=buffer,
+        )
+    buffer.flush()
+
+
 def _skip_transitive_dependents(
     failed_step_id: str,
-    steps: list[StepDef],
+    dag: DagIndex,
     org_id: str,
     run_id: str,
     already_skipped: set[str],
@@ -427,21 +515,16 @@ def _skip_transitive_dependents(
     Only skips steps that are not already completed, running, or skipped.
     Returns the set of newly skipped step IDs.
     """
-    to_skip = get_transitive_dependents(failed_step_id, steps)
+    to_skip = get_transitive_dependents(failed_step_id, dag)
     to_skip -= completed | running | already_skipped
 
-    newly_skipped: set[str] = set()
+    _batch_skip(
+        org_id, run_id, to_skip, f"Step skipped (dependency '{failed_step_id}' failed)",
+    )
     for skip_id in to_skip:
-        update_step_status(org_id, run_id, skip_id, "skipped")
-        write_event(
-            org_id, run_id, "progress",
-            step_id=skip_id,
-            payload={"message": f"Step skipped (dependency '{failed_step_id}' failed)"},
-        )
-        print(f"[orchestrator] Step {skip_id} -> skipped (depends on failed {failed_step_id})")
-        newly_skipped.add(skip_id)
+        log.info("Step %s -> skipped (depends on failed %s)", skip_id, failed_step_id)
 
-    return newly_skipped
+    return to_skip
 
 
 # ---------------------------------------------------------------------------
@@ -460,11 +543,11 @@ def _write_summary(
     c, f, s = len(completed), len(failed), len(skipped)
 
     if f == 0 and s == 0:
-        print(f"[orchestrator] All {c}/{total} steps completed")
+        log.info("All %s/%s steps completed", c, total)
         return
 
     summary = f"{c} of {total} steps completed, {f} failed, {s} skipped"
-    print(f"[orchestrator] {summary}")
+    log.info("%s", summary)
 
     failed_ids = sorted(failed)
     raise StepFailedError(
@@ -492,29 +575,34 @@ def run_orchestration(
 
     Raises StepFailedError if any step fails (after all possible steps finish).
     """
+    # No-op if the process already configured logging
+    logging.basicConfig(level=logging.INFO, format="[%(name)s] %(message)s", stream=sys.stdout)
+
     steps = sorted(playbook.steps, key=lambda s: s.order)
 
     if not steps:
-        print("[orchestrator] No steps to execute")
+        log.info("No steps to execute")
         return
 
     # --- Validate DAG ---
-    validate_dag(steps)
-    print(f"[orchestrator] DAG validated: {len(steps)} steps, no cycles")
+    dag = DagIndex(steps)
+    validate_dag(dag)
+    log.info("DAG validated: %s steps, no cycles", len(steps))
 
     # --- Initialize Firestore step docs ---
     initialize_step_docs(org_id, run_id, steps)
-    print(f"[orchestrator] Initialized {len(steps)} step docs")
+    log.info("Initialized %s step docs", len(steps))
 
     # --- Load role assignments from run doc ---
     role_assignments = read_role_assignments(org_id, run_id)
     if role_assignments:
-        print(f"[orchestrator] Role assignments: {list(role_assignments.keys())}")
+        log.info("Role assignments: %s", list(role_assignments.keys()))
     else:
-        print("[orchestrator] No role assignments on run doc — will use Firestore member lookup")
+        log.info("No role assignments on run doc — will use Firestore member lookup")
 
     # --- Build step lookup ---
-    step_map: dict[str, StepDef] = {s.id: s for s in steps}
+    step_map = dag.step_map
+    all_ids = frozenset(step_map)
     total = len(steps)
 
     # --- State tracking ---
@@ -527,169 +615,211 @@ def run_orchestration(
     oauth_notified: set[str] = set()  # Steps that already emitted oauth_required
     input_notified: set[str] = set()  # Steps that already emitted step_input_request
     paused_notified: dict[str, bool] = {}
-    step_start_times: dict[str, float] = {}
-
-    # --- Main DAG scheduling loop ---
-    while True:
-        # 1. Launch newly ready steps (exclude those waiting for OAuth or input)
-        ready = get_ready_steps(
-            steps, completed, failed | skipped, running | waiting_oauth | waiting_input,
-        )
-
-        if ready:
-            if len(ready) > 1:
-                ids = [s.id for s in ready]
-                write_event(
-                    org_id, run_id, "progress",
-                    payload={"message": f"Starting steps in parallel: [{', '.join(ids)}]"},
-                )
-                print(f"[orchestrator] Launching parallel: {ids}")
-
-            for step in ready:
-                write_event(
-                    org_id, run_id, "progress",
-                    payload={
-                        "message": f"Preparing step {step.order} of {total}: {step.title}",
-                    },
-                )
-                update_run_status(org_id, run_id, "running", current_step_id=step.id)
-
-                result = _check_oauth_and_launch(
-                    step, org_id, run_id, namespace, oauth_notified, input_notified, step_map,
-                    role_assignments=role_assignments,
-                )
-                if result == "launched":
-                    running.add(step.id)
-                    step_start_times[step.id] = time.time()
-                elif result == "waiting_oauth":
-                    waiting_oauth.add(step.id)
-                elif result == "waiting_input":
-                    waiting_input.add(step.id)
-
-        # 1b. Re-check waiting_for_oauth steps (token may have been granted)
-        for step_id in list(waiting_oauth):
-            status = read_step_status(org_id, run_id, step_id)
-            if status == "ready":
-                # Token was granted — onOAuthGranted set status to "ready"
-                step = step_map[step_id]
-                waiting_oauth.discard(step_id)
-
-                # After OAuth clears, check if step needs JIT inputs
-                inputs_ok = _check_step_inputs(step, org_id, run_id, input_notified)
-                if not inputs_ok:
-                    waiting_input.add(step_id)
-                    print(f"[orchestrator] Step {step_id} OAuth granted — now waiting for inputs")
-                    continue
-
-                prior = _collect_prior_reports(step, step_map, org_id, run_id)
-                print(f"[orchestrator] Step {step_id} OAuth granted — launching")
-                _launch_step(step, org_id, run_id, namespace, prior_reports=prior)
-                running.add(step_id)
-                step_start_times[step_id] = time.time()
-
-        # 1c. Re-check waiting_for_input steps (user may have provided input)
-        for step_id in list(waiting_input):
-            response = read_step_input_response(org_id, run_id, step_id)
-            if response:
-                step = step_map[step_id]
-                waiting_input.discard(step_id)
-                # Write resolved values to step doc
-                values = (response.get("payload") or {}).get("values", {})
-                write_step_input_values(org_id, run_id, step_id, values)
-                prior = _collect_prior_reports(step, step_map, org_id, run_id)
-                print(f"[orchestrator] Step {step_id} inputs received — launching")
-                _launch_step(step, org_id, run_id, namespace, prior_reports=prior)
-                running.add(step_id)
-                step_start_times[step_id] = time.time()
-
-        # 2. Check termination: nothing running/waiting and nothing more can be launched
-        if not running and not waiting_oauth and not waiting_input:
-            remaining = {s.id for s in steps} - completed - failed - skipped
-            if not remaining:
-                break
+    step_deadlines: dict[str, float] = {}  # Current monotonic timeout per running step
+    deadline_heap: list[tuple[float, str]] = []  # (deadline, step_id), earliest first
+    ready_queue = ReadyQueue(dag)  # Emits each step once, when its deps complete
+
+    # --- Step status listener (pushes changes instead of per-step polling) ---
+    statuses: dict[str, str | None] = {}  # Latest status per step, main thread only
+    status_events: queue.Queue[tuple[str, str | None]] = queue.Queue()
+    status_watch = watch_step_statuses(
+        org_id, run_id, lambda sid, status: status_events.put((sid, status)),
+    )
 
-            # Remaining steps are blocked by failures — mark them skipped
-            for rem_id in remaining:
-                update_step_status(org_id, run_id, rem_id, "skipped")
-                write_event(
-                    org_id, run_id, "progress",
-                    step_id=rem_id,
-                    payload={"message": "Step skipped (blocked by failed dependency)"},
-                )
-                print(f"[orchestrator] Step {rem_id} -> skipped (blocked)")
-                skipped.add(rem_id)
-            break
-
-        # 3. Poll all running steps once
-        for step_id in list(running):
-            step = step_map[step_id]
-
-            # Timeout check
-            elapsed = time.time() - step_start_times.get(step_id, time.time())
-            timeout_seconds = step.timeout_minutes * 60
-
-            if elapsed > timeout_seconds:
-                error_msg = f"Step timed out after {timeout_seconds}s"
-                update_step_status(
-                    org_id, run_id, step_id, "failed",
-                    error={"code": "STEP_TIMEOUT", "message": error_msg},
-                )
-                write_event(
-                    org_id, run_id, "step_failed",
-                    step_id=step_id,
-                    payload={"stepId": step_id, "error": error_msg},
-                )
-                print(f"[orchestrator] Step {step_id} TIMED OUT")
-                running.discard(step_id)
-                failed.add(step_id)
-                newly_skipped = _skip_transitive_dependents(
-                    step_id, steps, org_id, run_id, skipped, completed, running,
+    try:
+        # --- Main DAG scheduling loop ---
+        while True:
+            # 1. Launch newly ready steps (waiting/running steps are never re-emitted)
+            ready = ready_queue.pop_ready()
+
+            if ready:
+                # Wave bookkeeping (progress events + run status) in one batched commit
+                wave = FirestoreWriteBuffer()
+                if len(ready) > 1:
+                    ids = [s.id for s in ready]
+                    write_event(
+                        org_id, run_id, "progress",
+                        payload={"message": f"Starting steps in parallel: [{', '.join(ids)}]"},
+                        buffer=wave,
+                    )
+                    log.info("Launching parallel: %s", ids)
+
+                for step in ready:
+                    write_event(
+                        org_id, run_id, "progress",
+                        payload={
+                            "message": f"Preparing step {step.order} of {total}: {step.title}",
+                        },
+                        buffer=wave,
+                    )
+                update_run_status(
+                    org_id, run_id, "running", current_step_id=ready[-1].id, buffer=wave,
                 )
-                skipped |= newly_skipped
-                continue
+                wave.flush()
 
-            # Normal status poll
-            result = _poll_step_once(org_id, run_id, step_id, paused_notified)
+                def prepare_and_launch(step: StepDef) -> tuple[str, float]:
+                    result = _check_oauth_and_launch(
+                        step, org_id, run_id, namespace, oauth_notified, input_notified, step_map,
+                        role_assignments=role_assignments,
+                    )
+                    return result, time.monotonic()
+
+                # Launches are network-bound (Firestore + K8s API), so overlap them
+                if len(ready) == 1:
+                    outcomes = [prepare_and_launch(ready[0])]
+                else:
+                    with ThreadPoolExecutor(
+                        max_workers=min(len(ready), MAX_PARALLEL_LAUNCHES),
+                    ) as pool:
+                        outcomes = list(pool.map(prepare_and_launch, ready))
+
+                for step, (result, started_at) in zip(ready, outcomes):
+                    if result == "launched":
+                        running.add(step.id)
+                        _arm_deadline(step, started_at, step_deadlines, deadline_heap)
+                    elif result == "waiting_oauth":
+                        waiting_oauth.add(step.id)
+                    elif result == "waiting_input":
+                        waiting_input.add(step.id)
+
+            # 1b. Re-check waiting_for_oauth steps (token may have been granted)
+            for step_id in list(waiting_oauth):
+                if statuses.get(step_id) == "ready":
+                    # Token was granted — onOAuthGranted set status to "ready"
+                    step = step_map[step_id]
+                    waiting_oauth.discard(step_id)
+
+                    # After OAuth clears, check if step needs JIT inputs
+                    inputs_ok = _check_step_inputs(step, org_id, run_id, input_notified)
+                    if not inputs_ok:
+                        waiting_input.add(step_id)
+                        log.info("Step %s OAuth granted — now waiting for inputs", step_id)
+                        continue
 
-            if result is not None:
-                if result == "ready":
-                    # Step was re-set to ready (e.g. OAuth granted) — re-launch
-                    running.discard(step_id)
                     prior = _collect_prior_reports(step, step_map, org_id, run_id)
+                    log.info("Step %s OAuth granted — launching", step_id)
                     _launch_step(step, org_id, run_id, namespace, prior_reports=prior)
+                    statuses[step_id] = "running"
                     running.add(step_id)
-                    step_start_times[step_id] = time.time()
-                    continue
+                    _arm_deadline(step, time.monotonic(), step_deadlines, deadline_heap)
+
+            # 1c. Re-check waiting_for_input steps (user may have provided input)
+            for step_id in list(waiting_input):
+                response = read_step_input_response(org_id, run_id, step_id)
+                if response:
+                    step = step_map[step_id]
+                    waiting_input.discard(step_id)
+                    # Write resolved values to step doc
+                    values = (response.get("payload") or {}).get("values", {})
+                    write_step_input_values(org_id, run_id, step_id, values)
+                    prior = _collect_prior_reports(step, step_map, org_id, run_id)
+                    log.info("Step %s inputs received — launching", step_id)
+                    _launch_step(step, org_id, run_id, namespace, prior_reports=prior)
+                    statuses[step_id] = "running"
+                    running.add(step_id)
+                    _arm_deadline(step, time.monotonic(), step_deadlines, deadline_heap)
 
-                running.discard(step_id)
-                _handle_step_completion(step, result, org_id, run_id)
+            # 2. Check termination: nothing running/waiting and nothing more can be launched
+            if not running and not waiting_oauth and not waiting_input:
+                remaining = all_ids - completed - failed - skipped
+                if not remaining:
+                    break
 
-                if result == "completed":
-                    completed.add(step_id)
+                # Remaining steps are blocked by failures — mark them skipped
+                _batch_skip(
+                    org_id, run_id, remaining, "Step skipped (blocked by failed dependency)",
+                )
+                for rem_id in remaining:
+                    log.info("Step %s -> skipped (blocked)", rem_id)
+                skipped |= remaining
+                break
 
-                elif result == "failed":
+            # 3. Fail running steps whose deadline has passed (earliest first)
+            now = time.monotonic()
+            while deadline_heap and deadline_heap[0][0] <= now:
+                deadline, step_id = heapq.heappop(deadline_heap)
+                if step_id in running and step_deadlines.get(step_id) == deadline:
+                    step = step_map[step_id]
+                    timeout_seconds = step.timeout_minutes * 60
+                    error_msg = f"Step timed out after {timeout_seconds}s"
+                    update_step_status(
+                        org_id, run_id, step_id, "failed",
+                        error={"code": "STEP_TIMEOUT", "message": error_msg},
+                    )
+                    write_event(
+                        org_id, run_id, "step_failed",
+                        step_id=step_id,
+                        payload={"stepId": step_id, "error": error_msg},
+                    )
+                    log.info("Step %s TIMED OUT", step_id)
+                    running.discard(step_id)
                     failed.add(step_id)
                     newly_skipped = _skip_transitive_dependents(
-                        step_id, steps, org_id, run_id, skipped, completed, running,
+                        step_id, dag, org_id, run_id, skipped, completed, running,
                     )
                     skipped |= newly_skipped
 
-                elif result == "skipped":
-                    skipped.add(step_id)
-
-        # 4. Check for abort
-        run_data = read_run(org_id, run_id)
-        if run_data and run_data.get("status") == "aborted":
-            print("[orchestrator] Run aborted by user — exiting gracefully")
-            for sid in list(running):
-                update_step_status(org_id, run_id, sid, "skipped")
-                skipped.add(sid)
-            running.clear()
-            raise RunAbortedError("Run aborted by user")
-
-        # 5. Sleep + heartbeat
-        time.sleep(DEFAULT_POLL_INTERVAL)
-        update_run_heartbeat(org_id, run_id)
+            # 3b. Evaluate the latest listener status of each running step
+            for step_id in list(running):
+                step = step_map[step_id]
+                result = _poll_step_once(
+                    org_id, run_id, step_id, statuses.get(step_id), paused_notified,
+                )
+
+                if result is not None:
+                    if result == "ready":
+                        # Step was re-set to ready (e.g. OAuth granted) — re-launch
+                        running.discard(step_id)
+                        prior = _collect_prior_reports(step, step_map, org_id, run_id)
+                        _launch_step(step, org_id, run_id, namespace, prior_reports=prior)
+                        statuses[step_id] = "running"
+                        running.add(step_id)
+                        _arm_deadline(step, time.monotonic(), step_deadlines, deadline_heap)
+                        continue
+
+                    running.discard(step_id)
+                    _handle_step_completion(step, result, org_id, run_id)
+
+                    if result == "completed":
+                        completed.add(step_id)
+                        ready_queue.on_step_completed(step_id)
+
+                    elif result == "failed":
+                        failed.add(step_id)
+                        newly_skipped = _skip_transitive_dependents(
+                            step_id, dag, org_id, run_id, skipped, completed, running,
+                        )
+                        skipped |= newly_skipped
+
+                    elif result == "skipped":
+                        skipped.add(step_id)
+
+            # 4. Check for abort
+            if read_run_status(org_id, run_id) == "aborted":
+                log.info("Run aborted by user — exiting gracefully")
+                for sid in list(running):
+                    update_step_status(org_id, run_id, sid, "skipped")
+                    skipped.add(sid)
+                running.clear()
+                raise RunAbortedError("Run aborted by user")
+
+            # 5. Wait for the next status change (or the nearest step timeout) + heartbeat
+            wait = DEFAULT_POLL_INTERVAL
+            if deadline_heap:
+                wait = min(wait, deadline_heap[0][0] - time.monotonic())
+            listened = running | waiting_oauth
+            if not _wait_for_status_changes(status_events, statuses, wait) and listened:
+                # Quiet interval — reconcile running and OAuth-waiting steps
+                # (whose "ready" only arrives via the listener) in one bulk
+                # read in case the stream dropped an update.
+                try:
+                    flush_writes()
+                except Exception as exc:
+                    log.warning("Queued status writes not committed yet: %s", exc)
+                statuses.update(read_step_statuses(org_id, run_id, listened))
+            update_run_heartbeat(org_id, run_id)
+    finally:
+        status_watch.unsubscribe()
 
     # --- Final summary ---
     _write_summary(steps, completed, failed, skipped)
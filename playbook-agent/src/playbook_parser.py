@@ -6,18 +6,27 @@ a structured PlaybookDefinition for hydration and orchestration.
 
 from __future__ import annotations
 
+import functools
+import os
 import re
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
 import yaml
 
+# libyaml-backed loader when available (same safe semantics, much faster)
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 # ---------------------------------------------------------------------------
 # Dataclasses
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class VariableDef:
     name: str
     source: str
@@ -25,7 +34,7 @@ class VariableDef:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class StepInputDef:
     name: str
     type: str = "text"      # e.g. "github:repository", "slack:channel", "text"
@@ -34,7 +43,7 @@ class StepInputDef:
     required: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class StepDef:
     id: str
     order: int
@@ -53,7 +62,7 @@ class StepDef:
     required_connections: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaybookDefinition:
     name: str
     version: str
@@ -66,6 +75,10 @@ class PlaybookDefinition:
     steps: list[StepDef]
     markdown_body: str
     step_sections: dict[str, str] = field(default_factory=dict)
+    # Compiled variable resolver, set lazily by hydration.hydrate_playbook()
+    resolver: Callable[[dict], dict[str, str]] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -84,20 +97,16 @@ def _parse_frontmatter(content: str) -> tuple[dict, str]:
     Returns (frontmatter_dict, markdown_body).
     Raises ValueError if frontmatter is missing or malformed.
     """
-    trimmed = content.strip()
-    if not trimmed.startswith("---"):
+    # One pass: "<leading whitespace>---<yaml>---<body>"
+    parts = content.split("---", 2)
+    if len(parts) < 2 or parts[0].strip():
         raise ValueError("PLAYBOOK.md is missing YAML frontmatter (must start with ---)")
-
-    end_idx = trimmed.index("---", 3) if "---" in trimmed[3:] else -1
-    if end_idx == -1:
+    if len(parts) < 3:
         raise ValueError("PLAYBOOK.md has malformed YAML frontmatter (missing closing ---)")
 
-    # Find actual end position (index in trimmed, accounting for the 3-char offset)
-    end_idx = trimmed.index("---", 3)
-    yaml_str = trimmed[3:end_idx].strip()
-    body = trimmed[end_idx + 3:].strip()
+    yaml_str, body = parts[1], parts[2].strip()
 
-    parsed = yaml.safe_load(yaml_str)
+    parsed = yaml.load(yaml_str, Loader=_Loader)
     if not parsed or not isinstance(parsed, dict):
         raise ValueError("PLAYBOOK.md YAML frontmatter is empty or not a mapping")
 
@@ -120,6 +129,17 @@ def _parse_variables(raw: list | None) -> list[VariableDef]:
     return result
 
 
+# Alternate step keys → preferred spelling.  The preferred key wins when a
+# step sets both.
+_KEYMAP = {
+    "assigned_role": "assignedRole",
+    "agent_image": "agentImage",
+    "timeout_minutes": "timeoutMinutes",
+    "depends_on": "dependencies",
+    "requiredConnections": "required_connections",
+}
+
+
 def _parse_steps(raw: list | None) -> list[StepDef]:
     if not raw or not isinstance(raw, list):
         return []
@@ -127,9 +147,12 @@ def _parse_steps(raw: list | None) -> list[StepDef]:
     for i, s in enumerate(raw):
         if not isinstance(s, dict):
             continue
+        # Normalise alternate spellings once so each field is a single lookup
+        s = {**{_KEYMAP[k]: v for k, v in s.items() if k in _KEYMAP}, **s}
+
         # Derive agentImage from api field if not set directly
         raw_api = s.get("api", "")
-        raw_agent_image = s.get("agentImage", s.get("agent_image", ""))
+        raw_agent_image = s.get("agentImage", "")
         if not raw_agent_image and raw_api:
             raw_agent_image = f"api-agent-{raw_api}"
 
@@ -151,18 +174,18 @@ def _parse_steps(raw: list | None) -> list[StepDef]:
             id=s.get("id", f"step-{i + 1}"),
             order=s.get("order", i + 1),
             title=s.get("title", f"Step {i + 1}"),
-            assigned_role=s.get("assignedRole", s.get("assigned_role", "")),
+            assigned_role=s.get("assignedRole", ""),
             agent_image=raw_agent_image,
             api=raw_api,
             skills=s.get("skills", []) or [],
             inputs=step_inputs,
-            timeout_minutes=int(s.get("timeoutMinutes", s.get("timeout_minutes", 30))),
+            timeout_minutes=int(s.get("timeoutMinutes", 30)),
             interactive=bool(s.get("interactive", False)),
             approval=s.get("approval", "approve_only"),
-            dependencies=s.get("dependencies", s.get("depends_on", [])) or [],
+            dependencies=s.get("dependencies", []) or [],
             description=s.get("description", ""),
             instruction=s.get("instruction", ""),
-            required_connections=s.get("required_connections", s.get("requiredConnections", [])) or [],
+            required_connections=s.get("required_connections", []) or [],
         ))
     return result
 
@@ -173,18 +196,18 @@ def _parse_step_sections(body: str) -> dict[str, str]:
     Splits on `## Step: {step-id}` headings. Each section spans from its
     heading to the next step heading (or end of body).
     """
-    matches = list(_STEP_HEADING_RE.finditer(body))
-    if not matches:
+    # (step_id, content start, heading start) per heading, in body order
+    headings = [(m.group(1), m.end(), m.start()) for m in _STEP_HEADING_RE.finditer(body)]
+    if not headings:
         return {}
 
-    sections: dict[str, str] = {}
-    for i, m in enumerate(matches):
-        step_id = m.group(1)
-        start = m.end()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(body)
-        sections[step_id] = body[start:end].strip()
-
-    return sections
+    # Each section ends where the next heading starts
+    ends = [heading_start for _, _, heading_start in headings[1:]]
+    ends.append(len(body))
+    return {
+        step_id: body[start:end].strip()
+        for (step_id, start, _), end in zip(headings, ends)
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -211,8 +234,19 @@ def parse_playbook(content: str) -> PlaybookDefinition:
     )
 
 
-def parse_playbook_file(path: str) -> PlaybookDefinition:
-    """Read a PLAYBOOK.md file and parse it."""
+@functools.lru_cache(maxsize=64)
+def _parse_playbook_file_cached(path: str, mtime_ns: int, size: int) -> PlaybookDefinition:
     with open(path, "r", encoding="utf-8") as f:
         content = f.read()
     return parse_playbook(content)
+
+
+def parse_playbook_file(path: str) -> PlaybookDefinition:
+    """Read a PLAYBOOK.md file and parse it.
+
+    Results are cached per (path, mtime, size), so re-parsing an unchanged
+    file returns the same PlaybookDefinition instance — callers must treat it
+    as read-only.
+    """
+    st = os.stat(path)
+    return _parse_playbook_file_cached(path, st.st_mtime_ns, st.st_size)
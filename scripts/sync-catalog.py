@@ -28,43 +28,72 @@ Usage:
 """
 
 import argparse
+import hashlib
+import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
 import yaml
 
+# libyaml-backed loader when available (same safe semantics, much faster)
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 REQUIRED_FIELDS = ["name", "description", "version", "category", "steps"]
+STEP_REQUIRED_FIELDS = ["id", "title", "assignedRole"]
+
+# Set forms of the required-field lists for one C-level subset check per
+# mapping; the ordered lists are only walked to word the error messages.
+_REQUIRED_KEYS = frozenset(REQUIRED_FIELDS)
+_STEP_REQUIRED_KEYS = frozenset(STEP_REQUIRED_FIELDS)
 COLLECTION_NAME = "playbook_catalog"
+CACHE_VERSION = 2
 
+# Fields left out of contentHash so that re-syncing unchanged content is a no-op
+UNHASHED_FIELDS = ("lastUpdated", "syncedAt", "contentHash")
+
+# Firestore limits a commit to 500 writes and ~10 MiB; catalog docs embed the
+# full markdown, so batches are also cut by approximate payload size.
+MAX_BATCH_WRITES = 500
+MAX_BATCH_BYTES = 8 * 1024 * 1024
 
-def parse_playbook_md(filepath: Path) -> dict:
-    """Parse a PLAYBOOK.md file, extracting YAML frontmatter and full content."""
-    text = filepath.read_text(encoding="utf-8")
 
-    # Split on --- delimiters to extract frontmatter
-    parts = text.split("---", 2)
-    if len(parts) < 3:
+def parse_playbook_md(filepath: str) -> dict:
+    """Parse a PLAYBOOK.md file, extracting YAML frontmatter and full content."""
+    with open(filepath, "rb") as f:
+        raw = f.read()
+
+    # Locate the --- delimiters and slice out only the frontmatter. The YAML
+    # loader reads the UTF-8 bytes directly; the file is decoded to str once,
+    # for "content", with newlines normalised as text-mode open() would.
+    start = raw.find(b"---")
+    end = raw.find(b"---", start + 3) if start != -1 else -1
+    if end == -1:
         raise ValueError(f"Invalid PLAYBOOK.md format: missing --- delimiters in {filepath}")
 
-    frontmatter_str = parts[1].strip()
-    frontmatter = yaml.safe_load(frontmatter_str)
+    frontmatter = yaml.load(raw[start + 3:end].strip(), Loader=_Loader)
     if not isinstance(frontmatter, dict):
         raise ValueError(f"Invalid YAML frontmatter in {filepath}")
 
     return {
         "frontmatter": frontmatter,
-        "content": text,
+        "content": raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n"),
     }
 
 
-def validate_frontmatter(frontmatter: dict, filepath: Path) -> list[str]:
+def validate_frontmatter(frontmatter: dict, filepath: str) -> list[str]:
     """Validate required fields are present. Returns list of error messages."""
     errors = []
-    for field in REQUIRED_FIELDS:
-        if field not in frontmatter:
-            errors.append(f"{filepath}: missing required field '{field}'")
+    if not frontmatter.keys() >= _REQUIRED_KEYS:
+        for field in REQUIRED_FIELDS:
+            if field not in frontmatter:
+                errors.append(f"{filepath}: missing required field '{field}'")
 
     steps = frontmatter.get("steps", [])
     if not isinstance(steps, list):
@@ -74,9 +103,10 @@ def validate_frontmatter(frontmatter: dict, filepath: Path) -> list[str]:
             if not isinstance(step, dict):
                 errors.append(f"{filepath}: step {i} is not a dict")
                 continue
-            for req in ["id", "title", "assignedRole"]:
-                if req not in step:
-                    errors.append(f"{filepath}: step {i} missing required field '{req}'")
+            if not step.keys() >= _STEP_REQUIRED_KEYS:
+                for req in STEP_REQUIRED_FIELDS:
+                    if req not in step:
+                        errors.append(f"{filepath}: step {i} missing required field '{req}'")
             # Validate step inputs (JIT inputs)
             step_inputs = step.get("inputs", [])
             if step_inputs and not isinstance(step_inputs, list):
@@ -100,57 +130,45 @@ def validate_frontmatter(frontmatter: dict, filepath: Path) -> list[str]:
     return errors
 
 
-def determine_track(filepath: Path) -> str:
-    """Return 'verified' or 'community' based on the parent directory path."""
-    parts = filepath.parts
-    for part in parts:
-        if part == "verified":
-            return "verified"
-        if part == "community":
-            return "community"
+def determine_track(filepath: str, playbooks_dir: str) -> str:
+    """Return 'verified' or 'community' from the directory under playbooks_dir.
+
+    discover_playbooks() only yields files from playbooks_dir/{track}/, so the
+    track is always the first component of the relative path.
+    """
+    track = os.path.relpath(filepath, playbooks_dir).split(os.sep, 1)[0]
+    if track in ("verified", "community"):
+        return track
     raise ValueError(f"Cannot determine track for {filepath}: not under verified/ or community/")
 
 
-def extract_step_summary(steps: list[dict]) -> list[dict]:
-    """Extract lightweight step summary for catalog display.
+def summarize_steps(steps: list[dict]) -> tuple[list[dict], set[str]]:
+    """Extract the catalog step summary and the agent images in one pass.
 
-    Supports both v2 (agentImage) and v3 (api + skills) schemas.
+    Supports both v2 (agentImage) and v3 (api + skills) schemas; for v3 the
+    image name is derived from the api field.  ``steps`` must have passed
+    validate_frontmatter(), so every step is a dict with its required fields.
+    Returns (step_summary, agent_images).
     """
     summaries = []
+    images = set()
     for step in steps:
-        if not isinstance(step, dict):
-            continue
         api = step.get("api", "")
         agent_image = step.get("agentImage", "")
         if not agent_image and api:
             agent_image = f"api-agent-{api}"
+        if agent_image:
+            images.add(agent_image)
         summaries.append({
-            "id": step.get("id", ""),
-            "title": step.get("title", ""),
+            "id": step["id"],
+            "title": step["title"],
             "agentImage": agent_image,
-            "assignedRole": step.get("assignedRole", ""),
+            "assignedRole": step["assignedRole"],
             "api": api,
             "skills": step.get("skills", []) or [],
             "inputs": step.get("inputs", []) or [],
         })
-    return summaries
-
-
-def collect_agent_images(steps: list[dict]) -> set[str]:
-    """Collect unique agent image references from steps.
-
-    For v3 playbooks, derives image name from the api field.
-    """
-    images = set()
-    for step in steps:
-        if not isinstance(step, dict):
-            continue
-        image = step.get("agentImage", "")
-        if not image and step.get("api"):
-            image = f"api-agent-{step['api']}"
-        if image:
-            images.add(image)
-    return images
+    return summaries, images
 
 
 def build_catalog_doc(
@@ -160,8 +178,14 @@ def build_catalog_doc(
     track: str,
     repo_url: str,
     relative_path: str,
+    now_iso: str,
+    step_summary: list[dict],
 ) -> dict:
-    """Build a PlaybookCatalogDoc-shaped dict from parsed playbook data."""
+    """Build a PlaybookCatalogDoc-shaped dict from parsed playbook data.
+
+    ``now_iso`` is the sync timestamp, computed once per run by the caller;
+    ``step_summary`` comes from summarize_steps().
+    """
     metadata = frontmatter.get("metadata", {})
     if not isinstance(metadata, dict):
         metadata = {}
@@ -170,11 +194,7 @@ def build_catalog_doc(
     if not isinstance(tags, list):
         tags = []
 
-    steps = frontmatter.get("steps", [])
-
-    now = datetime.now(timezone.utc).isoformat()
-
-    return {
+    doc = {
         "id": playbook_id,
         "name": frontmatter.get("name", ""),
         "description": frontmatter.get("description", ""),
@@ -186,14 +206,71 @@ def build_catalog_doc(
         "author": metadata.get("author", frontmatter.get("author", "unknown")),
         "stars": 0,
         "content": content,
-        "stepSummary": extract_step_summary(steps),
+        "stepSummary": step_summary,
         "gitUrl": f"{repo_url}/blob/main/{relative_path}",
-        "lastUpdated": now,
-        "syncedAt": now,
+        "lastUpdated": now_iso,
+        "syncedAt": now_iso,
     }
+    doc["contentHash"] = content_hash(doc)
+    return doc
+
+
+def content_hash(doc: dict) -> str:
+    """SHA-256 over a catalog doc's fields, excluding timestamps."""
+    hashed = {k: v for k, v in doc.items() if k not in UNHASHED_FIELDS}
+    return hashlib.sha256(json.dumps(hashed, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def parse_one(
+    playbook_id: str,
+    filepath: str,
+    playbooks_dir: str,
+    repo_root: str,
+    repo_url: str,
+    now_iso: str,
+) -> tuple[dict | None, set[str], list[str]]:
+    """Parse, validate and build the catalog doc for one PLAYBOOK.md.
+
+    Top-level so it can run in a worker process.
+    Returns (doc, agent_images, errors); doc is None if there are errors.
+    """
+    try:
+        parsed = parse_playbook_md(filepath)
+    except ValueError as e:
+        return None, set(), [str(e)]
+
+    frontmatter = parsed["frontmatter"]
+
+    # Validate required fields
+    errors = validate_frontmatter(frontmatter, filepath)
+    if errors:
+        return None, set(), errors
+
+    # Determine track
+    try:
+        track = determine_track(filepath, playbooks_dir)
+    except ValueError as e:
+        return None, set(), [str(e)]
+
+    # Step summary for the catalog, plus agent images for validation
+    step_summary, images = summarize_steps(frontmatter["steps"])
+
+    # Build catalog doc
+    relative_path = os.path.relpath(filepath, repo_root)
+    doc = build_catalog_doc(
+        playbook_id=playbook_id,
+        frontmatter=frontmatter,
+        content=parsed["content"],
+        track=track,
+        repo_url=repo_url,
+        relative_path=relative_path,
+        now_iso=now_iso,
+        step_summary=step_summary,
+    )
+    return doc, images, []
 
 
-def discover_playbooks(playbooks_dir: Path) -> list[tuple[str, Path]]:
+def discover_playbooks(playbooks_dir: Path) -> list[tuple[str, str]]:
     """Find all PLAYBOOK.md files under verified/ and community/.
 
     Returns list of (playbook_id, filepath) tuples.
@@ -204,54 +281,114 @@ def discover_playbooks(playbooks_dir: Path) -> list[tuple[str, Path]]:
         track_path = playbooks_dir / track_dir
         if not track_path.is_dir():
             continue
-        for child in sorted(track_path.iterdir()):
-            if not child.is_dir():
-                continue
-            playbook_md = child / "PLAYBOOK.md"
-            if playbook_md.is_file():
+        # scandir entries carry their file type from the directory read, so
+        # only the PLAYBOOK.md check costs a stat per playbook
+        with os.scandir(track_path) as it:
+            children = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+        for child in children:
+            playbook_md = os.path.join(child.path, "PLAYBOOK.md")
+            if os.path.isfile(playbook_md):
                 results.append((child.name, playbook_md))
     return results
 
 
+def load_parse_cache(cache_path: Path) -> dict[str, dict]:
+    """Load cached catalog docs keyed by PLAYBOOK.md path (empty if missing or stale)."""
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("entries", {})
+
+
+def save_parse_cache(cache_path: Path, entries: dict[str, dict]) -> None:
+    """Write the parse cache (best-effort — a failed write only costs a re-parse)."""
+    try:
+        cache_path.write_text(
+            json.dumps({"version": CACHE_VERSION, "entries": entries}),
+            encoding="utf-8",
+        )
+    except OSError as e:
+        print(f"Warning: could not write parse cache {cache_path}: {e}", file=sys.stderr)
+
+
+def commit_batched(db, writes: list[tuple[str, str, dict | None]]) -> None:
+    """Commit ("set" | "delete", doc_id, data) writes as WriteBatch round-trips."""
+    collection_ref = db.collection(COLLECTION_NAME)
+    batch = db.batch()
+    count = 0
+    size = 0
+    for op, doc_id, data in writes:
+        # Firestore counts UTF-8 bytes, not characters
+        approx = len(data.get("content", "").encode("utf-8")) if data else 0
+        if count and (count >= MAX_BATCH_WRITES or size + approx > MAX_BATCH_BYTES):
+            batch.commit()
+            batch = db.batch()
+            count = 0
+            size = 0
+        ref = collection_ref.document(doc_id)
+        if op == "set":
+            batch.set(ref, data)
+        else:
+            batch.delete(ref)
+        count += 1
+        size += approx
+    if count:
+        batch.commit()
+
+
 def sync_to_firestore(db, catalog_docs: dict[str, dict], dry_run: bool = False) -> dict:
-    """Upsert catalog docs and delete removed ones.
+    """Upsert changed catalog docs and delete removed ones.
 
-    Returns dict with added, updated, deleted counts.
+    Docs whose contentHash matches the stored one are not rewritten.
+    Returns dict with added, updated, unchanged, deleted counts.
     """
-    # Get existing doc IDs (skip if dry-run without a db connection)
-    existing_ids: set[str] = set()
-    if db is not None:
-        collection_ref = db.collection(COLLECTION_NAME)
-        for doc in collection_ref.stream():
-            existing_ids.add(doc.id)
-
     added = 0
     updated = 0
+    unchanged = 0
     deleted = 0
+    writes: list[tuple[str, str, dict | None]] = []
+
+    # Stream existing doc IDs + content hashes (skip if dry-run without a db
+    # connection).  Projected to contentHash — the full docs embed markdown.
+    # Docs no longer in the repo are queued for deletion as they stream by,
+    # so only hashes of docs that are still wanted are kept.
+    existing_hashes: dict[str, str | None] = {}
+    if db is not None:
+        for doc in db.collection(COLLECTION_NAME).select(["contentHash"]).stream():
+            if doc.id in catalog_docs:
+                existing_hashes[doc.id] = (doc.to_dict() or {}).get("contentHash")
+                continue
+            if dry_run:
+                print(f"  [dry-run] Would delete: {doc.id}")
+            else:
+                writes.append(("delete", doc.id, None))
+            deleted += 1
 
     # Upsert
     for doc_id, doc_data in catalog_docs.items():
+        exists = doc_id in existing_hashes
+        if exists and existing_hashes[doc_id] == doc_data["contentHash"]:
+            unchanged += 1
+            continue
+
         if dry_run:
-            action = "update" if doc_id in existing_ids else "add"
+            action = "update" if exists else "add"
             print(f"  [dry-run] Would {action}: {doc_id}")
         else:
-            db.collection(COLLECTION_NAME).document(doc_id).set(doc_data)
+            writes.append(("set", doc_id, doc_data))
 
-        if doc_id in existing_ids:
+        if exists:
             updated += 1
         else:
             added += 1
 
-    # Delete removed
-    removed_ids = existing_ids - set(catalog_docs.keys())
-    for doc_id in removed_ids:
-        if dry_run:
-            print(f"  [dry-run] Would delete: {doc_id}")
-        else:
-            db.collection(COLLECTION_NAME).document(doc_id).delete()
-        deleted += 1
+    if writes:
+        commit_batched(db, writes)
 
-    return {"added": added, "updated": updated, "deleted": deleted}
+    return {"added": added, "updated": updated, "unchanged": unchanged, "deleted": deleted}
 
 
 def main():
@@ -275,6 +412,11 @@ def main():
         action="store_true",
         help="Skip Artifact Registry image validation (for bootstrapping)",
     )
+    parser.add_argument(
+        "--cache-file",
+        default=".sync-catalog-cache.json",
+        help="Parse cache reused for unchanged PLAYBOOK.md files (empty string disables)",
+    )
     args = parser.parse_args()
 
     playbooks_dir = Path(args.playbooks_dir)
@@ -302,49 +444,68 @@ def main():
         sys.exit(0)
 
     # Parse and validate
+    now_iso = datetime.now(timezone.utc).isoformat()
     all_errors: list[str] = []
     all_images: set[str] = set()
-    catalog_docs: dict[str, dict] = {}
+    docs_by_id: dict[str, dict] = {}
+
+    # Unchanged files (same mtime + size) reuse their previously built doc
+    cache_path = Path(args.cache_file) if args.cache_file else None
+    cache = load_parse_cache(cache_path) if cache_path else {}
+    new_cache: dict[str, dict] = {}
+    to_parse: list[tuple[str, str, os.stat_result]] = []
 
     for playbook_id, filepath in playbook_files:
-        print(f"Parsing: {filepath}")
-        try:
-            parsed = parse_playbook_md(filepath)
-        except ValueError as e:
-            all_errors.append(str(e))
+        st = os.stat(filepath)
+        entry = cache.get(filepath)
+        if (
+            entry
+            and entry.get("mtimeNs") == st.st_mtime_ns
+            and entry.get("size") == st.st_size
+            and entry.get("repoUrl") == args.repo_url
+        ):
+            print(f"Cached:  {filepath}")
+            doc = entry["doc"]
+            doc["syncedAt"] = now_iso
+            all_images.update(entry["images"])
+            docs_by_id[playbook_id] = doc
+            new_cache[filepath] = entry
             continue
 
-        frontmatter = parsed["frontmatter"]
+        print(f"Parsing: {filepath}")
+        to_parse.append((playbook_id, filepath, st))
+
+    # YAML parsing is CPU-bound, so spread it across processes
+    repo_root = str(playbooks_dir.parent)
+    jobs = [
+        (pid, fp, str(playbooks_dir), repo_root, args.repo_url, now_iso)
+        for pid, fp, _ in to_parse
+    ]
+    if len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+            results = list(pool.map(parse_one, *zip(*jobs)))
+    else:
+        results = [parse_one(*job) for job in jobs]
 
-        # Validate required fields
-        errors = validate_frontmatter(frontmatter, filepath)
+    for (playbook_id, filepath, st), (doc, images, errors) in zip(to_parse, results):
         if errors:
             all_errors.extend(errors)
             continue
-
-        # Determine track
-        try:
-            track = determine_track(filepath)
-        except ValueError as e:
-            all_errors.append(str(e))
-            continue
-
-        # Collect agent images for validation
-        steps = frontmatter.get("steps", [])
-        images = collect_agent_images(steps)
         all_images.update(images)
+        docs_by_id[playbook_id] = doc
+        new_cache[filepath] = {
+            "mtimeNs": st.st_mtime_ns,
+            "size": st.st_size,
+            "repoUrl": args.repo_url,
+            "images": sorted(images),
+            "doc": doc,
+        }
 
-        # Build catalog doc
-        relative_path = str(filepath.relative_to(playbooks_dir.parent))
-        doc = build_catalog_doc(
-            playbook_id=playbook_id,
-            frontmatter=frontmatter,
-            content=parsed["content"],
-            track=track,
-            repo_url=args.repo_url,
-            relative_path=relative_path,
-        )
-        catalog_docs[playbook_id] = doc
+    if cache_path:
+        save_parse_cache(cache_path, new_cache)
+
+    # Keep discovery order regardless of cache hits
+    catalog_docs = {pid: docs_by_id[pid] for pid, _ in playbook_files if pid in docs_by_id}
 
     # Report validation errors
     if all_errors:
@@ -375,7 +536,10 @@ def main():
         db = fs.client()
         result = sync_to_firestore(db, catalog_docs, dry_run=False)
 
-    print(f"\nSync complete: {result['added']} added, {result['updated']} updated, {result['deleted']} deleted")
+    print(
+        f"\nSync complete: {result['added']} added, {result['updated']} updated, "
+        f"{result['unchanged']} unchanged, {result['deleted']} deleted"
+    )
 
 
 if __name__ == "__main__":
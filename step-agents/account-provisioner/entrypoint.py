@@ -10,13 +10,12 @@ import os
 import sys
 import traceback
 
-from step_agent.checkpoint import clear_checkpoint, load_checkpoint
+from step_agent.checkpoint import clear_checkpoint, load_resume_state
 from step_agent.firestore_client import (
+    EventBuffer,
     read_input,
     read_run_context,
-    read_run_status,
     update_step_status,
-    write_event,
 )
 from step_agent.hitl_tools import (
     RunAbortedError,
@@ -34,18 +33,18 @@ from step_agent.storage_tools import write_report
 # ---------------------------------------------------------------------------
 
 
-def _phase_fresh(org_id: str, run_id: str, step_id: str) -> None:
+def _phase_fresh(org_id: str, run_id: str, step_id: str, buf: EventBuffer) -> None:
     """Phase 1: LLM generates provisioning plan and requests IT approval."""
     update_step_status(org_id, run_id, step_id, "running")
-    write_event(
-        org_id, run_id, "step_started",
+    buf.append(
+        "step_started",
         step_id=step_id,
         payload={"stepId": step_id},
     )
 
     skill = load_skill("/app/skills")
-    write_event(
-        org_id, run_id, "progress",
+    buf.append(
+        "progress",
         step_id=step_id,
         payload={"message": f"Loaded skill: {skill.name}"},
     )
@@ -56,8 +55,8 @@ def _phase_fresh(org_id: str, run_id: str, step_id: str) -> None:
     email = context.get("new_hire_email", "user@company.com")
     manager = context.get("manager_email", "manager@company.com")
 
-    write_event(
-        org_id, run_id, "progress",
+    buf.append(
+        "progress",
         step_id=step_id,
         payload={
             "message": f"Generating account provisioning plan for {new_hire}",
@@ -87,15 +86,17 @@ def _phase_fresh(org_id: str, run_id: str, step_id: str) -> None:
         ),
         max_tokens=2048,
         temperature=0.5,
+        buf=buf,
     )
 
-    write_event(
-        org_id, run_id, "progress",
+    buf.append(
+        "progress",
         step_id=step_id,
         payload={"message": "Account list ready — requesting IT approval", "percent": 50},
     )
 
     # Request approval — this checkpoints and exits (never returns)
+    buf.flush()
     request_approval(
         org_id, run_id, step_id,
         description="Please review the AI-generated account provisioning plan and approve to proceed.",
@@ -110,13 +111,14 @@ def _phase_after_approval(
     org_id: str,
     run_id: str,
     step_id: str,
+    buf: EventBuffer,
     decision: dict,
     checkpoint_data: dict,
 ) -> None:
     """Phase 2: post Slack welcome + create Jira task, write report, complete."""
     update_step_status(org_id, run_id, step_id, "running")
-    write_event(
-        org_id, run_id, "progress",
+    buf.append(
+        "progress",
         step_id=step_id,
         payload={"message": "Resumed — processing IT approval decision", "percent": 75},
     )
@@ -133,8 +135,8 @@ def _phase_after_approval(
 
     print(f"[account-provisioner] Approval decision: {decision_value}")
 
-    write_event(
-        org_id, run_id, "agent_tool_use",
+    buf.append(
+        "agent_tool_use",
         step_id=step_id,
         payload={
             "toolName": "request_approval",
@@ -156,11 +158,12 @@ def _phase_after_approval(
         print(f"[account-provisioner] Wrote report: {result['storagePath']}")
 
         clear_checkpoint(org_id, run_id, step_id)
-        write_event(
-            org_id, run_id, "step_completed",
+        buf.append(
+            "step_completed",
             step_id=step_id,
             payload={"resultSummary": summary},
         )
+        buf.flush()
         update_step_status(org_id, run_id, step_id, "completed", result_summary=summary)
         print(f"[account-provisioner] Step completed: {summary}")
         sys.exit(0)
@@ -171,11 +174,12 @@ def _phase_after_approval(
     # Post Slack welcome message
     slack_result = {}
     slack_status = "skipped"
-    write_event(
-        org_id, run_id, "progress",
+    buf.append(
+        "progress",
         step_id=step_id,
         payload={"message": f"Posting welcome message to Slack #{slack_channel}", "percent": 80},
     )
+    buf.flush(wait=False)
     try:
         # Normalize: accept "general" or "#general"
         channel_arg = slack_channel if slack_channel.startswith("#") else f"#{slack_channel}"
@@ -185,8 +189,8 @@ def _phase_after_approval(
             text=f":wave: Welcome {new_hire} to {company}! They're joining us on {start_date}. Say hello! :tada:",
         )
         slack_status = f"posted (ts={slack_result.get('ts', '')})"
-        write_event(
-            org_id, run_id, "agent_tool_use",
+        buf.append(
+            "agent_tool_use",
             step_id=step_id,
             payload={
                 "toolName": "slack_post_message",
@@ -202,11 +206,12 @@ def _phase_after_approval(
     # Create Jira onboarding task
     jira_result = {}
     jira_status = "skipped"
-    write_event(
-        org_id, run_id, "progress",
+    buf.append(
+        "progress",
         step_id=step_id,
         payload={"message": "Creating Jira onboarding task", "percent": 85},
     )
+    buf.flush(wait=False)
     try:
         jira_result = create_issue(
             org_id,
@@ -221,8 +226,8 @@ def _phase_after_approval(
             labels=["onboarding", "provisioning"],
         )
         jira_status = f"created {jira_result.get('key', 'issue')}"
-        write_event(
-            org_id, run_id, "agent_tool_use",
+        buf.append(
+            "agent_tool_use",
             step_id=step_id,
             payload={
                 "toolName": "jira_create_issue",
@@ -243,8 +248,8 @@ def _phase_after_approval(
     report += f"- Jira: {jira_status}\n"
     report += f"\n_{status_label} by IT._\n"
 
-    write_event(
-        org_id, run_id, "progress",
+    buf.append(
+        "progress",
         step_id=step_id,
         payload={"message": "Writing provisioning report", "percent": 90},
     )
@@ -259,11 +264,12 @@ def _phase_after_approval(
     clear_checkpoint(org_id, run_id, step_id)
 
     summary = f"Account provisioning approved. Slack: {slack_status}. Jira: {jira_status}."
-    write_event(
-        org_id, run_id, "step_completed",
+    buf.append(
+        "step_completed",
         step_id=step_id,
         payload={"resultSummary": summary},
     )
+    buf.flush()
     update_step_status(
         org_id, run_id, step_id, "completed",
         result_summary=summary,
@@ -291,17 +297,19 @@ def main() -> None:
     if resume_thread_id:
         print(f"[account-provisioner] Resuming from checkpoint (thread={resume_thread_id})")
 
+    buf = EventBuffer(org_id, run_id)
+
     try:
         if not resume_thread_id:
-            _phase_fresh(org_id, run_id, step_id)
+            _phase_fresh(org_id, run_id, step_id, buf)
         else:
-            checkpoint = load_checkpoint(org_id, run_id, step_id)
+            # Checkpoint (step doc) and run status in one batched read
+            checkpoint, run_status = load_resume_state(org_id, run_id, step_id)
             if checkpoint is None:
                 raise RuntimeError(
                     f"RESUME_THREAD_ID set but no checkpoint found for step {step_id}"
                 )
 
-            run_status = read_run_status(org_id, run_id)
             if run_status == "aborted":
                 raise RunAbortedError("Run was aborted while step was paused")
 
@@ -323,7 +331,7 @@ def main() -> None:
                     "decision": input_doc.get("payload", {}).get("decision", "reject"),
                     "revisedContent": input_doc.get("payload", {}).get("revisedContent"),
                 }
-                _phase_after_approval(org_id, run_id, step_id, decision, data)
+                _phase_after_approval(org_id, run_id, step_id, buf, decision, data)
             else:
                 raise RuntimeError(f"Unknown checkpoint phase: {phase}")
 
@@ -332,6 +340,7 @@ def main() -> None:
 
     except RunAbortedError:
         print("[account-provisioner] Run was aborted")
+        buf.flush()
         update_step_status(org_id, run_id, step_id, "skipped")
         clear_checkpoint(org_id, run_id, step_id)
         sys.exit(0)
@@ -341,11 +350,12 @@ def main() -> None:
         traceback.print_exc()
 
         try:
-            write_event(
-                org_id, run_id, "step_failed",
+            buf.append(
+                "step_failed",
                 step_id=step_id,
                 payload={"error": str(exc)},
             )
+            buf.flush()
             update_step_status(
                 org_id, run_id, step_id, "failed",
                 error={"code": "STEP_AGENT_CRASH", "message": str(exc)},
@@ -9,26 +9,31 @@ accumulated state the agent needs to resume after a HITL pause.
 
 from __future__ import annotations
 
+import functools
+
 from step_agent.firestore_client import _get_db
 
 from firebase_admin import firestore
 
 
+@functools.lru_cache(maxsize=64)
+def _step_ref(org_id: str, run_id: str, step_id: str):
+    """Return the (cached) DocumentReference for a step document."""
+    return _get_db().collection("orgs").document(org_id) \
+        .collection("playbook_runs").document(run_id) \
+        .collection("steps").document(step_id)
+
+
 def save_checkpoint(org_id: str, run_id: str, step_id: str, data: dict) -> None:
     """Write checkpoint data to the step document in Firestore."""
-    db = _get_db()
-    db.collection("orgs").document(org_id) \
-        .collection("playbook_runs").document(run_id) \
-        .collection("steps").document(step_id) \
+    _step_ref(org_id, run_id, step_id) \
         .update({"checkpoint": data, "updatedAt": firestore.SERVER_TIMESTAMP})
 
 
 def load_checkpoint(org_id: str, run_id: str, step_id: str) -> dict | None:
     """Load checkpoint data from the step document. Returns None if no checkpoint."""
-    db = _get_db()
-    doc = db.collection("orgs").document(org_id) \
-        .collection("playbook_runs").document(run_id) \
-        .collection("steps").document(step_id).get()
+    # Field mask: only the checkpoint subtree is sent back, not the whole step doc
+    doc = _step_ref(org_id, run_id, step_id).get(field_paths=["checkpoint"])
     if not doc.exists:
         return None
     return (doc.to_dict() or {}).get("checkpoint")
@@ -36,8 +41,24 @@ def load_checkpoint(org_id: str, run_id: str, step_id: str) -> dict | None:
 
 def clear_checkpoint(org_id: str, run_id: str, step_id: str) -> None:
     """Remove checkpoint data from the step document (called on step completion)."""
-    db = _get_db()
-    db.collection("orgs").document(org_id) \
-        .collection("playbook_runs").document(run_id) \
-        .collection("steps").document(step_id) \
+    _step_ref(org_id, run_id, step_id) \
         .update({"checkpoint": firestore.DELETE_FIELD})
+
+
+def load_resume_state(org_id: str, run_id: str, step_id: str) -> tuple[dict | None, str | None]:
+    """Load the step's checkpoint and the run's status in one batched read.
+
+    Returns ``(checkpoint, run_status)``; either is None if missing.
+    """
+    step_ref = _step_ref(org_id, run_id, step_id)
+    run_ref = step_ref.parent.parent
+    checkpoint = run_status = None
+    for doc in _get_db().get_all([run_ref, step_ref], field_paths=["checkpoint", "status"]):
+        if not doc.exists:
+            continue
+        data = doc.to_dict() or {}
+        if doc.reference.path == step_ref.path:
+            checkpoint = data.get("checkpoint")
+        else:
+            run_status = data.get("status")
+    return checkpoint, run_status
@@ -6,6 +6,13 @@ Uses Application Default Credentials (Workload Identity on GKE).
 
 from __future__ import annotations
 
+import atexit
+import itertools
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+
 import firebase_admin
 from firebase_admin import firestore
 
@@ -15,6 +22,12 @@ from firebase_admin import firestore
 
 _app: firebase_admin.App | None = None
 
+# Firestore rejects WriteBatch commits with more than 500 operations
+_MAX_BATCH_WRITES = 500
+
+# Events committed in one batch share a server timestamp; clientSeq orders them
+_event_seq = itertools.count()
+
 
 def _get_db() -> firestore.firestore.Client:
     global _app
@@ -62,6 +75,19 @@ def update_step_status(
 # ---------------------------------------------------------------------------
 
 
+def _event_data(event_type: str, step_id: str | None, payload: dict | None) -> dict:
+    # clientTimestamp orders events across processes when they share a server
+    # timestamp; clientSeq breaks ties within this process.
+    return {
+        "type": event_type,
+        "stepId": step_id,
+        "timestamp": firestore.SERVER_TIMESTAMP,
+        "clientTimestamp": datetime.now(timezone.utc),
+        "clientSeq": next(_event_seq),
+        "payload": payload or {},
+    }
+
+
 def write_event(
     org_id: str,
     run_id: str,
@@ -72,18 +98,116 @@ def write_event(
 ) -> str:
     """Append an event to the run's events subcollection. Returns the event ID."""
     db = _get_db()
-    data = {
-        "type": event_type,
-        "stepId": step_id,
-        "timestamp": firestore.SERVER_TIMESTAMP,
-        "payload": payload or {},
-    }
+    data = _event_data(event_type, step_id, payload)
     _, doc_ref = db.collection("orgs").document(org_id) \
         .collection("playbook_runs").document(run_id) \
         .collection("events").add(data)
     return doc_ref.id
 
 
+class EventBuffer:
+    """Collects a run's events in memory and writes them in one batch.
+
+    ``append()`` takes the same arguments as ``write_event()`` (minus the
+    org/run IDs) and allocates the event ID client-side.  ``flush()`` commits
+    everything appended so far in WriteBatches of up to 500 writes; callers
+    flush at phase boundaries, before a HITL pause, and before exiting.
+    Events committed together share the batch's server timestamp, so each
+    one also records ``clientTimestamp`` and ``clientSeq`` (see _event_data).
+
+    ``flush(wait=False)`` hands the batch to a background thread so progress
+    events don't block the caller.  Batches are committed in order, and the
+    next blocking ``flush()`` waits for the background ones first.  A batch
+    the background thread fails to commit is kept and retried by the next
+    flush.  Events may be appended and flushed from any thread.
+    """
+
+    def __init__(self, org_id: str, run_id: str) -> None:
+        self._events_ref = _get_db().collection("orgs").document(org_id) \
+            .collection("playbook_runs").document(run_id) \
+            .collection("events")
+        self._pending: list[tuple] = []
+        self._lock = threading.Lock()
+        self._background: queue.Queue | None = None
+
+    def append(
+        self,
+        event_type: str,
+        *,
+        step_id: str | None = None,
+        payload: dict | None = None,
+    ) -> str:
+        """Queue an event. Returns the event ID."""
+        doc_ref = self._events_ref.document()
+        event = (doc_ref, _event_data(event_type, step_id, payload))
+        with self._lock:
+            self._pending.append(event)
+        return doc_ref.id
+
+    def flush(self, *, wait: bool = True) -> None:
+        """Write all queued events in batch commits.
+
+        A blocking flush that fails raises and keeps the events queued.
+        """
+        if not wait:
+            with self._lock:
+                if self._pending:
+                    # Enqueued under the lock so batches keep their order
+                    self._background_queue().put(self._pending)
+                    self._pending = []
+            return
+        if self._background is not None:
+            self._background.join()
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+        try:
+            self._commit(pending)
+        except Exception:
+            self._requeue(pending)
+            raise
+
+    def _requeue(self, pending: list[tuple]) -> None:
+        # Failed events predate anything appended since; set() by doc ID makes
+        # re-committing any that did land harmless.
+        with self._lock:
+            self._pending[:0] = pending
+
+    @staticmethod
+    def _commit(pending: list[tuple]) -> None:
+        db = _get_db()
+        for start in range(0, len(pending), _MAX_BATCH_WRITES):
+            batch = db.batch()
+            for doc_ref, data in pending[start:start + _MAX_BATCH_WRITES]:
+                batch.set(doc_ref, data)
+            batch.commit()
+
+    def _background_queue(self) -> queue.Queue:
+        if self._background is None:
+            self._background = queue.Queue()
+            threading.Thread(target=self._drain_background, daemon=True).start()
+            atexit.register(self._wait_background, 5.0)
+        return self._background
+
+    def _drain_background(self) -> None:
+        while True:
+            pending = self._background.get()
+            try:
+                self._commit(pending)
+            except Exception as exc:
+                print(f"[step-agent] Background event write failed, keeping it for the next flush: {exc}")
+                self._requeue(pending)
+            finally:
+                self._background.task_done()
+
+    def _wait_background(self, timeout: float) -> None:
+        # Bounded drain at interpreter exit (Queue.join has no timeout)
+        deadline = time.monotonic() + timeout
+        while self._background.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+
 # ---------------------------------------------------------------------------
 # Context reading
 # ---------------------------------------------------------------------------
@@ -14,17 +14,39 @@ Usage:
     # result = {'id': '...', 'key': 'HR-42', 'self': '...'}
 """
 
+import hashlib
+import time
+
 import requests
 
+from step_agent.http import SESSION
 from step_agent.secrets_client import read_oauth_token
 
 ATLASSIAN_RESOURCES_URL = "https://api.atlassian.com/oauth/token/accessible-resources"
 JIRA_API_BASE = "https://api.atlassian.com/ex/jira"
 
+# Cloud IDs are stable per token; re-discover after this many seconds
+CLOUD_ID_TTL = 3600
+
+# sha256(access token) -> (cloud ID, monotonic time fetched); tokens aren't kept in memory
+_CLOUD_ID_CACHE: dict[str, tuple[str, float]] = {}
+
+
+def _token_key(access_token: str) -> str:
+    return hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+
 
 def _get_cloud_id(access_token: str) -> str:
-    """Discover the Atlassian Cloud ID for the authed user's Jira site."""
-    resp = requests.get(
+    """Discover the Atlassian Cloud ID for the authed user's Jira site.
+
+    Cached per token for CLOUD_ID_TTL seconds.
+    """
+    key = _token_key(access_token)
+    cached = _CLOUD_ID_CACHE.get(key)
+    if cached is not None and time.monotonic() - cached[1] < CLOUD_ID_TTL:
+        return cached[0]
+
+    resp = SESSION.get(
         ATLASSIAN_RESOURCES_URL,
         headers={"Authorization": f"Bearer {access_token}"},
         timeout=15,
@@ -36,7 +58,9 @@ def _get_cloud_id(access_token: str) -> str:
             "No accessible Jira sites found. "
             "Ensure the Jira OAuth token has the correct scopes."
         )
-    return resources[0]["id"]
+    cloud_id = resources[0]["id"]
+    _CLOUD_ID_CACHE[key] = (cloud_id, time.monotonic())
+    return cloud_id
 
 
 def create_issue(
@@ -93,7 +117,7 @@ def create_issue(
     if labels:
         fields["labels"] = labels
 
-    resp = requests.post(
+    resp = SESSION.post(
         f"{JIRA_API_BASE}/{cloud_id}/rest/api/3/issue",
         headers={
             "Authorization": f"Bearer {access_token}",
@@ -102,6 +126,9 @@ def create_issue(
         json={"fields": fields},
         timeout=30,
     )
+    if resp.status_code in (401, 403):
+        # The site may no longer be reachable with this token — rediscover next time
+        _CLOUD_ID_CACHE.pop(_token_key(access_token), None)
     if not resp.ok:
         # Include response body for debugging (Jira returns detailed error messages)
         try:
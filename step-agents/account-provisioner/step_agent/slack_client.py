@@ -13,8 +13,7 @@ Usage:
     # result = {'ok': True, 'channel': 'C...', 'ts': '...'}
 """
 
-import requests
-
+from step_agent.http import SESSION
 from step_agent.secrets_client import read_oauth_token
 
 SLACK_POST_URL = "https://slack.com/api/chat.postMessage"
@@ -51,7 +50,7 @@ def post_message(
     if blocks:
         payload["blocks"] = blocks
 
-    resp = requests.post(
+    resp = SESSION.post(
         SLACK_POST_URL,
         headers={
             "Authorization": f"Bearer {token['accessToken']}",
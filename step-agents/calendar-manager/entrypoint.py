@@ -5,19 +5,22 @@ schedule -> create real Google Calendar events -> write report -> complete.
 No HITL pauses. Uses exception_only approval.
 
 Uses Claude API for generating a meeting schedule as structured JSON,
-then creates actual events via the Google Calendar API v3.
+then creates actual events via the Google Calendar API v3 while the schedule
+report is generated.
 """
 
 import json
 import os
 import sys
+import threading
 import traceback
+from concurrent.futures import Future
 
 from step_agent.firestore_client import (
+    EventBuffer,
     read_run_context,
     read_run_status,
     update_step_status,
-    write_event,
 )
 from step_agent.gcal_client import batch_create_events
 from step_agent.hitl_tools import RunAbortedError
@@ -36,6 +39,24 @@ def _parse_events_json(raw: str) -> list[dict]:
     return json.loads(text)
 
 
+def _run_in_background(fn, *args, **kwargs) -> Future:
+    """Run fn on a daemon thread and return a Future for its result.
+
+    Unlike a ThreadPoolExecutor worker, the thread is not joined at exit, so a
+    failed step can exit without waiting for the call to finish.
+    """
+    future: Future = Future()
+
+    def _target() -> None:
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=_target, daemon=True).start()
+    return future
+
+
 def main() -> None:
     run_id = os.environ.get("RUN_ID")
     org_id = os.environ.get("ORG_ID")
@@ -47,21 +68,23 @@ def main() -> None:
 
     print(f"[calendar-manager] Starting step={step_id} run={run_id} org={org_id}")
 
+    buf = EventBuffer(org_id, run_id)
+
     try:
         run_status = read_run_status(org_id, run_id)
         if run_status == "aborted":
             raise RunAbortedError("Run was aborted before step started")
 
         update_step_status(org_id, run_id, step_id, "running")
-        write_event(
-            org_id, run_id, "step_started",
+        buf.append(
+            "step_started",
             step_id=step_id,
             payload={"stepId": step_id},
         )
 
         skill = load_skill("/app/skills")
-        write_event(
-            org_id, run_id, "progress",
+        buf.append(
+            "progress",
             step_id=step_id,
             payload={"message": f"Loaded skill: {skill.name}"},
         )
@@ -73,8 +96,8 @@ def main() -> None:
         manager = context.get("manager_email", "manager@company.com")
         start_date = context.get("start_date", "TBD")
 
-        write_event(
-            org_id, run_id, "progress",
+        buf.append(
+            "progress",
             step_id=step_id,
             payload={
                 "message": f"Generating meeting schedule for {new_hire} with AI",
@@ -82,6 +105,8 @@ def main() -> None:
             },
         )
 
+        buf.flush(wait=False)
+
         # LLM generates structured JSON events
         events_json_raw = generate(
             org_id, run_id, step_id,
@@ -113,42 +138,34 @@ def main() -> None:
             ),
             max_tokens=3000,
             temperature=0.4,
+            buf=buf,
         )
 
         events = _parse_events_json(events_json_raw)
         print(f"[calendar-manager] LLM generated {len(events)} events")
 
-        write_event(
-            org_id, run_id, "progress",
+        buf.append(
+            "progress",
             step_id=step_id,
             payload={
                 "message": f"Creating {len(events)} Google Calendar events",
                 "percent": 45,
             },
         )
-
-        # Create real Google Calendar events
-        gcal_results = batch_create_events(org_id, events)
-        print(f"[calendar-manager] Created {len(gcal_results)} calendar events")
-
-        write_event(
-            org_id, run_id, "agent_tool_use",
-            step_id=step_id,
-            payload={
-                "toolName": "gcal_batch_create",
-                "args": {"count": len(events)},
-                "result": f"{len(gcal_results)} events created",
-            },
-        )
-
-        write_event(
-            org_id, run_id, "progress",
+        buf.append(
+            "progress",
             step_id=step_id,
             payload={"message": "Generating schedule report", "percent": 70},
         )
 
-        # LLM generates human-readable report
-        schedule_report = generate(
+        buf.flush(wait=False)
+
+        # The report prompt only needs the event list, so the LLM report call
+        # runs on a worker thread while the Google Calendar events are created.
+        # batch_create_events raises unless every event is created; the report
+        # is only used after it returns, and abandoned if it fails.
+        report_future = _run_in_background(
+            generate,
             org_id, run_id, step_id,
             system_prompt=(
                 "You are an HR operations expert. Generate a beautifully formatted "
@@ -160,13 +177,32 @@ def main() -> None:
                 f"Format this week-1 onboarding schedule for {new_hire} at {company} "
                 f"(starting {start_date}, manager: {manager}).\n\n"
                 f"Events data:\n{json.dumps(events, indent=2)}\n\n"
-                f"All {len(gcal_results)} events were created in Google Calendar.\n\n"
+                f"Each event is being added to Google Calendar; links will be "
+                f"listed after the schedule.\n\n"
                 f"Include a key contacts table and notes about calendar reminders."
             ),
             max_tokens=3000,
             temperature=0.5,
+            buf=buf,
         )
 
+        # Create real Google Calendar events
+        gcal_results = batch_create_events(org_id, events)
+        print(f"[calendar-manager] Created {len(gcal_results)} calendar events")
+
+        buf.append(
+            "agent_tool_use",
+            step_id=step_id,
+            payload={
+                "toolName": "gcal_batch_create",
+                "args": {"count": len(events)},
+                "result": f"{len(gcal_results)} events created",
+            },
+        )
+        buf.flush(wait=False)
+
+        schedule_report = report_future.result()
+
         # Append calendar links
         schedule_report += "\n\n---\n\n## Google Calendar Events\n\n"
         for i, r in enumerate(gcal_results):
@@ -181,11 +217,12 @@ def main() -> None:
         print(f"[calendar-manager] Wrote report: {result['storagePath']}")
 
         summary = f"Onboarding schedule created for {new_hire}. {len(gcal_results)} meetings added to Google Calendar."
-        write_event(
-            org_id, run_id, "step_completed",
+        buf.append(
+            "step_completed",
             step_id=step_id,
             payload={"resultSummary": summary},
         )
+        buf.flush()
         update_step_status(
             org_id, run_id, step_id, "completed",
             result_summary=summary,
@@ -198,6 +235,7 @@ def main() -> None:
 
     except RunAbortedError:
         print("[calendar-manager] Run was aborted")
+        buf.flush()
         update_step_status(org_id, run_id, step_id, "skipped")
         sys.exit(0)
 
@@ -206,11 +244,12 @@ def main() -> None:
         traceback.print_exc()
 
         try:
-            write_event(
-                org_id, run_id, "step_failed",
+            buf.append(
+                "step_failed",
                 step_id=step_id,
                 payload={"error": str(exc)},
             )
+            buf.flush()
             update_step_status(
                 org_id, run_id, step_id, "failed",
                 error={"code": "STEP_AGENT_CRASH", "message": str(exc)},
@@ -2,6 +2,8 @@
 
 Reads the Gmail OAuth token from Firestore org secrets (the token includes
 the calendar.events scope) and creates events on the new hire's calendar.
+batch_create_events() packs up to 50 inserts into one request to the
+Calendar batch endpoint (multipart/mixed).
 
 Usage:
     from step_agent.gcal_client import create_event, batch_create_events
@@ -18,27 +20,35 @@ Usage:
     )
 """
 
+import json
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 
+from step_agent.http import SESSION
 from step_agent.secrets_client import read_oauth_token
 
 GCAL_EVENTS_URL = "https://www.googleapis.com/calendar/v3/calendars/primary/events"
+GCAL_BATCH_URL = "https://www.googleapis.com/batch/calendar/v3"
+GCAL_EVENTS_PATH = "/calendar/v3/calendars/primary/events"
 
+# Google accepts at most 50 sub-requests per batch call
+MAX_BATCH_SIZE = 50
 
-def create_event(
-    org_id: str,
+# Concurrent event inserts when a batch call is rejected (each is an I/O-bound POST)
+MAX_PARALLEL_CREATES = 8
+
+
+def _event_body(
     summary: str,
     start: str,
     end: str,
-    *,
-    timezone: str = "America/New_York",
-    attendees: list[str] | None = None,
-    description: str = "",
-    location: str = "",
+    timezone: str,
+    attendees: list[str] | None,
+    description: str,
+    location: str,
 ) -> dict:
-    """Create a single Google Calendar event."""
-    token = read_oauth_token(org_id, "gmail")
-
     event_body: dict = {
         "summary": summary,
         "start": {"dateTime": start, "timeZone": timezone},
@@ -50,35 +60,51 @@ def create_event(
         event_body["location"] = location
     if attendees:
         event_body["attendees"] = [{"email": e} for e in attendees]
+    return event_body
+
+
+def _event_result(data: dict) -> dict:
+    return {
+        "id": data.get("id", ""),
+        "htmlLink": data.get("htmlLink", ""),
+        "status": data.get("status", ""),
+    }
 
-    resp = requests.post(
+
+def create_event(
+    org_id: str,
+    summary: str,
+    start: str,
+    end: str,
+    *,
+    timezone: str = "America/New_York",
+    attendees: list[str] | None = None,
+    description: str = "",
+    location: str = "",
+) -> dict:
+    """Create a single Google Calendar event."""
+    token = read_oauth_token(org_id, "gmail")
+
+    resp = SESSION.post(
         GCAL_EVENTS_URL,
         headers={
             "Authorization": f"Bearer {token['accessToken']}",
             "Content-Type": "application/json",
         },
-        json=event_body,
+        json=_event_body(summary, start, end, timezone, attendees, description, location),
         params={"sendUpdates": "all"} if attendees else {},
         timeout=30,
     )
     resp.raise_for_status()
 
-    data = resp.json()
-    return {
-        "id": data.get("id", ""),
-        "htmlLink": data.get("htmlLink", ""),
-        "status": data.get("status", ""),
-    }
+    return _event_result(resp.json())
 
 
-def batch_create_events(
-    org_id: str,
-    events: list[dict],
-) -> list[dict]:
-    """Create multiple calendar events. Raises on any failure."""
-    results = []
-    for evt in events:
-        result = create_event(
+def _create_events_parallel(org_id: str, events: list[dict]) -> list[dict]:
+    """Create events with one request each, concurrently, in input order."""
+
+    def _one(evt: dict) -> dict:
+        return create_event(
             org_id,
             summary=evt["summary"],
             start=evt["start"],
@@ -88,5 +114,139 @@ def batch_create_events(
             description=evt.get("description", ""),
             location=evt.get("location", ""),
         )
-        results.append(result)
+
+    with ThreadPoolExecutor(max_workers=min(len(events), MAX_PARALLEL_CREATES)) as pool:
+        return list(pool.map(_one, events))
+
+
+# ---------------------------------------------------------------------------
+# Batch endpoint (multipart/mixed)
+# ---------------------------------------------------------------------------
+
+
+def _batch_body(events: list[dict], boundary: str) -> str:
+    parts = []
+    for i, evt in enumerate(events):
+        body = _event_body(
+            evt["summary"],
+            evt["start"],
+            evt["end"],
+            evt.get("timezone", "America/New_York"),
+            evt.get("attendees"),
+            evt.get("description", ""),
+            evt.get("location", ""),
+        )
+        path = GCAL_EVENTS_PATH + ("?sendUpdates=all" if evt.get("attendees") else "")
+        parts.append(
+            f"--{boundary}\r\n"
+            "Content-Type: application/http\r\n"
+            f"Content-ID: <item{i}>\r\n"
+            "\r\n"
+            f"POST {path} HTTP/1.1\r\n"
+            "Content-Type: application/json\r\n"
+            "\r\n"
+            f"{json.dumps(body)}\r\n"
+        )
+    parts.append(f"--{boundary}--\r\n")
+    return "".join(parts)
+
+
+def _parse_batch_response(
+    resp: requests.Response, count: int,
+) -> tuple[list[dict | None], list[str]]:
+    """Split a multipart/mixed batch response into per-event results.
+
+    Returns the results in input order, with None for any sub-request that
+    failed or has no response, plus a description of each of those failures.
+    """
+    content_type = resp.headers.get("Content-Type", "")
+    _, _, boundary = content_type.partition("boundary=")
+    boundary = boundary.split(";", 1)[0].strip().strip('"')
+    if not boundary:
+        raise requests.HTTPError(f"Unexpected batch response type: {content_type}", response=resp)
+
+    results: list[dict | None] = [None] * count
+    errors: dict[int, str] = {}
+    for part in resp.text.split(f"--{boundary}"):
+        part = part.replace("\r\n", "\n").strip()
+        if not part or part == "--":
+            continue
+        part_headers, _, http_response = part.partition("\n\n")
+        index = None
+        for line in part_headers.splitlines():
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "content-id":
+                index = int(value.strip().strip("<>").rsplit("item", 1)[1])
+        if index is None or not 0 <= index < count:
+            continue
+        status_line, _, rest = http_response.partition("\n")
+        status = int(status_line.split()[1])
+        _, _, payload = rest.partition("\n\n")
+        if status >= 400:
+            errors[index] = f"event {index}: {status_line} {payload[:500]}"
+            continue
+        results[index] = _event_result(json.loads(payload))
+
+    for i, result in enumerate(results):
+        if result is None and i not in errors:
+            errors[i] = f"event {i}: no response"
+    return results, list(errors.values())
+
+
+def _insert_batch(token: dict, events: list[dict]) -> tuple[list[dict | None], list[str]]:
+    """Insert up to MAX_BATCH_SIZE events with a single batch request.
+
+    Returns per-event results (None where the insert failed) and the failures.
+    """
+    boundary = f"batch_{uuid.uuid4().hex}"
+    resp = SESSION.post(
+        GCAL_BATCH_URL,
+        headers={
+            "Authorization": f"Bearer {token['accessToken']}",
+            "Content-Type": f"multipart/mixed; boundary={boundary}",
+        },
+        data=_batch_body(events, boundary).encode("utf-8"),
+        timeout=60,
+    )
+    resp.raise_for_status()
+    return _parse_batch_response(resp, len(events))
+
+
+def batch_create_events(
+    org_id: str,
+    events: list[dict],
+) -> list[dict]:
+    """Create multiple calendar events. Raises on any failure.
+
+    Events are sent through the batch endpoint, 50 per request.  Events whose
+    sub-request failed are retried as concurrent single-event requests, so
+    events the batch already created are not inserted twice.  If a batch
+    request is rejected outright (4xx on the batch call itself, so none of its
+    events were created), the whole chunk is retried that way.  Results are
+    returned in input order.
+    """
+    if not events:
+        return []
+
+    token = read_oauth_token(org_id, "gmail")
+    results = []
+    for i in range(0, len(events), MAX_BATCH_SIZE):
+        chunk = events[i:i + MAX_BATCH_SIZE]
+        try:
+            chunk_results, errors = _insert_batch(token, chunk)
+        except requests.HTTPError as e:
+            if e.response is None or not 400 <= e.response.status_code < 500:
+                raise
+            print(f"[calendar-manager] Batch insert rejected ({e.response.status_code}); creating events individually")
+            chunk_results = [None] * len(chunk)
+        else:
+            if errors:
+                print(f"[calendar-manager] Retrying {len(errors)} failed batch inserts: {'; '.join(errors)}")
+
+        failed = [j for j, result in enumerate(chunk_results) if result is None]
+        if failed:
+            retried = _create_events_parallel(org_id, [chunk[j] for j in failed])
+            for j, result in zip(failed, retried):
+                chunk_results[j] = result
+        results.extend(chunk_results)
     return results
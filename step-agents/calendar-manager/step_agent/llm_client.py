@@ -16,8 +16,8 @@ Usage:
 
 import anthropic
 
-from step_agent.firestore_client import write_event
-from step_agent.secrets_client import read_ai_config
+from step_agent.firestore_client import EventBuffer, write_event
+from step_agent.secrets_client import invalidate, read_ai_config
 
 
 def generate(
@@ -30,11 +30,13 @@ def generate(
     max_tokens: int = 4096,
     temperature: float = 0.7,
     model: str | None = None,
+    buf: EventBuffer | None = None,
 ) -> str:
     """Generate text using Claude via the Anthropic SDK.
 
-    Reads the API key from Firestore org secrets on every call (no caching —
-    keys may rotate). Emits an agent_thinking event for observability.
+    Reads the API key from Firestore org secrets (cached per process for
+    secrets_client.CACHE_TTL; a rejected key is evicted so a rotated one is
+    picked up on the next call). Emits an agent_thinking event for observability.
 
     Args:
         org_id: Organization ID (for reading AI config from Firestore).
@@ -45,6 +47,9 @@ def generate(
         max_tokens: Maximum tokens in the response. Default 4096.
         temperature: Sampling temperature. Default 0.7.
         model: Override the model from Firestore config. Optional.
+        buf: The caller's EventBuffer. If given, the agent_thinking event is
+             queued on it and flushed in the background, so it is committed
+             after the events already buffered instead of ahead of them.
 
     Returns:
         The generated text content.
@@ -56,24 +61,29 @@ def generate(
     ai_config = read_ai_config(org_id)
     resolved_model = model or ai_config.get("model", "claude-sonnet-4-20250514")
 
-    write_event(
-        org_id, run_id, "agent_thinking",
-        step_id=step_id,
-        payload={
-            "message": f"Calling {resolved_model} (max_tokens={max_tokens})",
-            "model": resolved_model,
-        },
-    )
+    thinking = {
+        "message": f"Calling {resolved_model} (max_tokens={max_tokens})",
+        "model": resolved_model,
+    }
+    if buf is not None:
+        buf.append("agent_thinking", step_id=step_id, payload=thinking)
+        buf.flush(wait=False)
+    else:
+        write_event(org_id, run_id, "agent_thinking", step_id=step_id, payload=thinking)
 
     client = anthropic.Anthropic(api_key=ai_config["apiKey"])
 
-    response = client.messages.create(
-        model=resolved_model,
-        max_tokens=max_tokens,
-        temperature=temperature,
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_prompt}],
-    )
+    try:
+        response = client.messages.create(
+            model=resolved_model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system_prompt,
+            messages=[{"role": "user", "content": user_prompt}],
+        )
+    except anthropic.AuthenticationError:
+        invalidate(org_id, "ai_api_key")
+        raise
 
     # Extract text from the response
     text_blocks = [block.text for block in response.content if block.type == "text"]
@@ -12,15 +12,53 @@ Usage:
     gmail = read_oauth_token(org_id, 'gmail')  # {'accessToken': '...', ...}
 """
 
+import time
+
 from step_agent.firestore_client import _get_db
 
+# Secrets are re-read from Firestore after this many seconds so rotated keys
+# and refreshed tokens are picked up without a Firestore read on every call.
+CACHE_TTL = 300
+
+# Refresh OAuth tokens this many seconds before their expiresAt
+_EXPIRY_MARGIN = 60
+
+# (org_id, secret_id) -> (value, monotonic deadline)
+_cache: dict[tuple[str, str], tuple[dict, float]] = {}
+
+
+def _cache_get(org_id: str, secret_id: str) -> dict | None:
+    entry = _cache.get((org_id, secret_id))
+    if entry is None or time.monotonic() >= entry[1]:
+        return None
+    return dict(entry[0])
+
+
+def _cache_put(org_id: str, secret_id: str, value: dict, ttl: float = CACHE_TTL) -> None:
+    if ttl > 0:
+        _cache[(org_id, secret_id)] = (dict(value), time.monotonic() + ttl)
+
+
+def invalidate(org_id: str, secret_id: str | None = None) -> None:
+    """Drop cached secrets for an org (one secret, or all if secret_id is None).
+
+    Call after a rejected key or token so the next read goes to Firestore.
+    """
+    for key in [k for k in _cache if k[0] == org_id and secret_id in (None, k[1])]:
+        del _cache[key]
+
 
 def read_ai_config(org_id: str) -> dict:
     """Read AI API key config from Firestore org secrets.
 
     Returns dict with keys: provider, apiKey, model.
     Raises ValueError if the secret does not exist.
+    Cached for CACHE_TTL seconds.
     """
+    cached = _cache_get(org_id, "ai_api_key")
+    if cached is not None:
+        return cached
+
     ref = _get_db().collection("orgs").document(org_id).collection("secrets").document("ai_api_key")
     snap = ref.get()
     if not snap.exists:
@@ -29,11 +67,13 @@ def read_ai_config(org_id: str) -> dict:
             "Please configure an AI provider in the Skillmatic desktop app."
         )
     data = snap.to_dict()
-    return {
+    config = {
         "provider": data.get("provider", "anthropic"),
         "apiKey": data["apiKey"],
         "model": data.get("model", "claude-sonnet-4-20250514"),
     }
+    _cache_put(org_id, "ai_api_key", config)
+    return config
 
 
 def read_oauth_token(org_id: str, service: str) -> dict:
@@ -45,7 +85,12 @@ def read_oauth_token(org_id: str, service: str) -> dict:
 
     Returns dict with keys: accessToken, refreshToken, expiresAt, scopes.
     Raises ValueError if the secret does not exist.
+    Cached for CACHE_TTL seconds, or until shortly before expiresAt.
     """
+    cached = _cache_get(org_id, service)
+    if cached is not None:
+        return cached
+
     ref = _get_db().collection("orgs").document(org_id).collection("secrets").document(service)
     snap = ref.get()
     if not snap.exists:
@@ -54,9 +99,19 @@ def read_oauth_token(org_id: str, service: str) -> dict:
             f"Please connect {service.capitalize()} in the Skillmatic desktop app."
         )
     data = snap.to_dict()
-    return {
+    token = {
         "accessToken": data["accessToken"],
         "refreshToken": data.get("refreshToken"),
         "expiresAt": data.get("expiresAt", 0),
         "scopes": data.get("scopes", []),
     }
+
+    ttl = CACHE_TTL
+    expires_at = token["expiresAt"]
+    if expires_at:
+        # The desktop app may store epoch milliseconds (JS Date.now())
+        if expires_at > 1e12:
+            expires_at /= 1000
+        ttl = min(ttl, expires_at - time.time() - _EXPIRY_MARGIN)
+    _cache_put(org_id, service, token, ttl)
+    return token
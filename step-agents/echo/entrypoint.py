@@ -7,7 +7,7 @@ import os
 import sys
 import traceback
 
-from step_agent.firestore_client import update_step_status, write_event, read_run_context
+from step_agent.firestore_client import EventBuffer, update_step_status, read_run_context
 from step_agent.skill_loader import load_skill
 from step_agent.storage_tools import write_report
 
@@ -23,11 +23,13 @@ def main() -> None:
 
     print(f"[step-agent] Starting step={step_id} run={run_id} org={org_id}")
 
+    buf = EventBuffer(org_id, run_id)
+
     try:
         # ---- Mark step as running ----
         update_step_status(org_id, run_id, step_id, "running")
-        write_event(
-            org_id, run_id, "step_started",
+        buf.append(
+            "step_started",
             step_id=step_id,
             payload={"stepId": step_id},
         )
@@ -35,27 +37,27 @@ def main() -> None:
 
         # ---- Load SKILL.md ----
         skill = load_skill("/app/skills")
-        write_event(
-            org_id, run_id, "progress",
+        buf.append(
+            "progress",
             step_id=step_id,
             payload={"message": f"Loaded skill: {skill.name}"},
         )
-        write_event(
-            org_id, run_id, "log",
+        buf.append(
+            "log",
             step_id=step_id,
             payload={"message": f"Skill description: {skill.description}"},
         )
         print(f"[step-agent] Loaded skill: {skill.name} — {skill.description}")
 
         # ---- Read hydrated context ----
-        write_event(
-            org_id, run_id, "agent_thinking",
+        buf.append(
+            "agent_thinking",
             step_id=step_id,
             payload={"thought": "Reading hydrated context from playbook run..."},
         )
         context = read_run_context(org_id, run_id)
-        write_event(
-            org_id, run_id, "agent_tool_use",
+        buf.append(
+            "agent_tool_use",
             step_id=step_id,
             payload={
                 "toolName": "read_run_context",
@@ -66,13 +68,13 @@ def main() -> None:
         print(f"[step-agent] Read context: {len(context)} variables")
 
         # ---- Execute skill (echo: build report from context) ----
-        write_event(
-            org_id, run_id, "agent_thinking",
+        buf.append(
+            "agent_thinking",
             step_id=step_id,
             payload={"thought": "Building echo report from context variables..."},
         )
-        write_event(
-            org_id, run_id, "progress",
+        buf.append(
+            "progress",
             step_id=step_id,
             payload={"message": "Building report", "percent": 25},
         )
@@ -110,16 +112,16 @@ def main() -> None:
 
         report_content = "\n".join(report_lines)
 
-        write_event(
-            org_id, run_id, "progress",
+        buf.append(
+            "progress",
             step_id=step_id,
             payload={"message": "Report built, writing to shared storage", "percent": 75},
         )
 
         # ---- Write report (local + Firebase Storage) ----
         result = write_report(org_id, run_id, step_id, report_content)
-        write_event(
-            org_id, run_id, "agent_tool_use",
+        buf.append(
+            "agent_tool_use",
             step_id=step_id,
             payload={
                 "toolName": "write_report",
@@ -131,11 +133,12 @@ def main() -> None:
 
         # ---- Mark step as completed ----
         summary = f"Echo skill completed. {len(context)} context variables echoed."
-        write_event(
-            org_id, run_id, "step_completed",
+        buf.append(
+            "step_completed",
             step_id=step_id,
             payload={"resultSummary": summary},
         )
+        buf.flush()
         update_step_status(
             org_id, run_id, step_id, "completed",
             result_summary=summary,
@@ -148,11 +151,12 @@ def main() -> None:
         traceback.print_exc()
 
         try:
-            write_event(
-                org_id, run_id, "step_failed",
+            buf.append(
+                "step_failed",
                 step_id=step_id,
                 payload={"error": str(exc)},
             )
+            buf.flush()
             update_step_status(
                 org_id, run_id, step_id, "failed",
                 error={"code": "STEP_AGENT_CRASH", "message": str(exc)},
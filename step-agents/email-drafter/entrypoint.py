@@ -11,13 +11,12 @@ import os
 import sys
 import traceback
 
-from step_agent.checkpoint import clear_checkpoint, load_checkpoint
+from step_agent.checkpoint import clear_checkpoint, load_resume_state
 from step_agent.firestore_client import (
+    EventBuffer,
     read_input,
     read_run_context,
-    read_run_status,
     update_step_status,
-    write_event,
 )
 from step_agent.gmail_client import send_email
 from step_agent.hitl_tools import (
@@ -35,18 +34,18 @@ from step_agent.storage_tools import write_report
 # ---------------------------------------------------------------------------
 
 
-def _phase_fresh(org_id: str, run_id: str, step_id: str) -> None:
+def _phase_fresh(org_id: str, run_id: str, step_id: str, buf: EventBuffer) -> None:
     """Phase 1: fresh start — load skill, read context, LLM generates question."""
     update_step_status(org_id, run_id, step_id, "running")
-    write_event(
-        org_id, run_id, "step_started",
+    buf.append(
+        "step_started",
         step_id=step_id,
         payload={"stepId": step_id},
     )
 
     skill = load_skill("/app/skills")
-    write_event(
-        org_id, run_id, "progress",
+    buf.append(
+        "progress",
         step_id=step_id,
         payload={"message": f"Loaded skill: {skill.name}"},
     )
@@ -55,8 +54,8 @@ def _phase_fresh(org_id: str, run_id: str, step_id: str) -> None:
     new_hire = context.get("new_hire_name", "the new hire")
     company = context.get("company_name", "the company")
 
-    write_event(
-        org_id, run_id, "progress",
+    buf.append(
+        "progress",
         step_id=step_id,
         payload={
             "message": f"Preparing welcome email for {new_hire}",
@@ -80,9 +79,11 @@ def _phase_fresh(org_id: str, run_id: str, step_id: str) -> None:
         ),
         max_tokens=200,
         temperature=0.7,
+        buf=buf,
     )
 
     # Ask user — this checkpoints and exits (never returns)
+    buf.flush()
     ask_user(
         org_id, run_id, step_id,
         question=question.strip(),
@@ -98,13 +99,14 @@ def _phase_after_question(
     org_id: str,
     run_id: str,
     step_id: str,
+    buf: EventBuffer,
     user_answer: str,
     checkpoint_data: dict,
 ) -> None:
     """Phase 2: user answered the question — LLM drafts email, request approval."""
     update_step_status(org_id, run_id, step_id, "running")
-    write_event(
-        org_id, run_id, "progress",
+    buf.append(
+        "progress",
         step_id=step_id,
         payload={"message": "Resumed — generating welcome email draft with AI", "percent": 40},
     )
@@ -145,15 +147,17 @@ def _phase_after_question(
         ),
         max_tokens=2048,
         temperature=0.7,
+        buf=buf,
     )
 
-    write_event(
-        org_id, run_id, "progress",
+    buf.append(
+        "progress",
         step_id=step_id,
         payload={"message": "Email draft ready — requesting review", "percent": 60},
     )
 
     # Request approval — this checkpoints and exits (never returns)
+    buf.flush()
     request_approval(
         org_id, run_id, step_id,
         description="Please review the AI-generated welcome email draft. You may approve it as-is, edit it, or reject it.",
@@ -168,13 +172,14 @@ def _phase_after_approval(
     org_id: str,
     run_id: str,
     step_id: str,
+    buf: EventBuffer,
     decision: dict,
     checkpoint_data: dict,
 ) -> None:
     """Phase 3: user approved/rejected — send via Gmail, write report, complete."""
     update_step_status(org_id, run_id, step_id, "running")
-    write_event(
-        org_id, run_id, "progress",
+    buf.append(
+        "progress",
         step_id=step_id,
         payload={"message": "Resumed — processing approval decision", "percent": 80},
     )
@@ -184,8 +189,8 @@ def _phase_after_approval(
     context = checkpoint_data.get("context", {})
     print(f"[email-drafter] Approval decision: {decision_value}")
 
-    write_event(
-        org_id, run_id, "agent_tool_use",
+    buf.append(
+        "agent_tool_use",
         step_id=step_id,
         payload={
             "toolName": "request_approval",
@@ -211,11 +216,12 @@ def _phase_after_approval(
         print(f"[email-drafter] Wrote report: {result['storagePath']}")
 
         clear_checkpoint(org_id, run_id, step_id)
-        write_event(
-            org_id, run_id, "step_completed",
+        buf.append(
+            "step_completed",
             step_id=step_id,
             payload={"resultSummary": summary},
         )
+        buf.flush()
         update_step_status(org_id, run_id, step_id, "completed", result_summary=summary)
         print(f"[email-drafter] Step completed: {summary}")
         sys.exit(0)
@@ -226,11 +232,12 @@ def _phase_after_approval(
     name = context.get("new_hire_name", "New Hire")
     company = context.get("company_name", "Company")
 
-    write_event(
-        org_id, run_id, "progress",
+    buf.append(
+        "progress",
         step_id=step_id,
         payload={"message": f"Sending welcome email to {recipient} via Gmail", "percent": 85},
     )
+    buf.flush(wait=False)
 
     gmail_result = {}
     gmail_status = "skipped"
@@ -244,8 +251,8 @@ def _phase_after_approval(
         )
         gmail_status = f"sent (id={gmail_result.get('id', 'unknown')})"
         print(f"[email-drafter] Gmail sent: {gmail_result}")
-        write_event(
-            org_id, run_id, "agent_tool_use",
+        buf.append(
+            "agent_tool_use",
             step_id=step_id,
             payload={
                 "toolName": "gmail_send",
@@ -260,8 +267,8 @@ def _phase_after_approval(
     status_label = "Revised" if decision_value == "revise" else "Approved"
     report_content = final_content + f"\n\n---\n\n_Gmail: {gmail_status}. {status_label} by reviewer._\n"
 
-    write_event(
-        org_id, run_id, "progress",
+    buf.append(
+        "progress",
         step_id=step_id,
         payload={"message": "Writing final email report", "percent": 90},
     )
@@ -277,11 +284,12 @@ def _phase_after_approval(
 
     summary = f"Welcome email draft complete. Gmail: {gmail_status}."
 
-    write_event(
-        org_id, run_id, "step_completed",
+    buf.append(
+        "step_completed",
         step_id=step_id,
         payload={"resultSummary": summary},
     )
+    buf.flush()
     update_step_status(
         org_id, run_id, step_id, "completed",
         result_summary=summary,
@@ -309,18 +317,20 @@ def main() -> None:
     if resume_thread_id:
         print(f"[email-drafter] Resuming from checkpoint (thread={resume_thread_id})")
 
+    buf = EventBuffer(org_id, run_id)
+
     try:
         if not resume_thread_id:
-            _phase_fresh(org_id, run_id, step_id)
+            _phase_fresh(org_id, run_id, step_id, buf)
         else:
-            checkpoint = load_checkpoint(org_id, run_id, step_id)
+            # Checkpoint (step doc) and run status in one batched read
+            checkpoint, run_status = load_resume_state(org_id, run_id, step_id)
             if checkpoint is None:
                 raise RuntimeError(
                     f"RESUME_THREAD_ID set but no checkpoint found for step {step_id}"
                 )
 
             # Check if run was aborted while paused
-            run_status = read_run_status(org_id, run_id)
             if run_status == "aborted":
                 raise RunAbortedError("Run was aborted while step was paused")
 
@@ -340,13 +350,13 @@ def main() -> None:
 
             if phase == "waiting_for_answer":
                 user_answer = input_doc.get("payload", {}).get("answer", "")
-                _phase_after_question(org_id, run_id, step_id, user_answer, data)
+                _phase_after_question(org_id, run_id, step_id, buf, user_answer, data)
             elif phase == "waiting_for_approval":
                 decision = {
                     "decision": input_doc.get("payload", {}).get("decision", "reject"),
                     "revisedContent": input_doc.get("payload", {}).get("revisedContent"),
                 }
-                _phase_after_approval(org_id, run_id, step_id, decision, data)
+                _phase_after_approval(org_id, run_id, step_id, buf, decision, data)
             else:
                 raise RuntimeError(f"Unknown checkpoint phase: {phase}")
 
@@ -355,6 +365,7 @@ def main() -> None:
 
     except RunAbortedError:
         print("[email-drafter] Run was aborted")
+        buf.flush()
         update_step_status(org_id, run_id, step_id, "skipped")
         clear_checkpoint(org_id, run_id, step_id)
         sys.exit(0)
@@ -364,11 +375,12 @@ def main() -> None:
         traceback.print_exc()
 
         try:
-            write_event(
-                org_id, run_id, "step_failed",
+            buf.append(
+                "step_failed",
                 step_id=step_id,
                 payload={"error": str(exc)},
             )
+            buf.flush()
             update_step_status(
                 org_id, run_id, step_id, "failed",
                 error={"code": "STEP_AGENT_CRASH", "message": str(exc)},
@@ -20,6 +20,7 @@ from email.mime.text import MIMEText
 
 import requests
 
+from step_agent.http import SESSION
 from step_agent.secrets_client import read_oauth_token
 
 GMAIL_SEND_URL = "https://gmail.googleapis.com/gmail/v1/users/me/messages/send"
@@ -61,7 +62,7 @@ def send_email(
 
     raw = base64.urlsafe_b64encode(mime.as_bytes()).decode("ascii")
 
-    resp = requests.post(
+    resp = SESSION.post(
         GMAIL_SEND_URL,
         headers={
             "Authorization": f"Bearer {token['accessToken']}",
@@ -0,0 +1,25 @@
+"""HTTP — shared requests.Session for the third-party API clients.
+
+The Slack, Jira and Google clients send requests through SESSION so calls
+reuse pooled keep-alive connections instead of paying a TCP + TLS handshake
+per request.  requests.Session is safe to share across the threads used by
+gcal_client.batch_create_events.
+
+Transient failures (429/502/503/504 and connection errors) are retried with
+backoff for idempotent methods only; POSTs are never retried, so a create call
+cannot be duplicated.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+    ),
+)
@@ -14,13 +14,12 @@ import os
 import sys
 import traceback
 
-from step_agent.checkpoint import clear_checkpoint, load_checkpoint
+from step_agent.checkpoint import clear_checkpoint, load_resume_state
 from step_agent.firestore_client import (
+    EventBuffer,
     read_input,
     read_run_context,
-    read_run_status,
     update_step_status,
-    write_event,
 )
 from step_agent.hitl_tools import (
     RunAbortedError,
@@ -36,37 +35,38 @@ from step_agent.storage_tools import write_report
 # ---------------------------------------------------------------------------
 
 
-def _phase_fresh(org_id: str, run_id: str, step_id: str) -> None:
+def _phase_fresh(org_id: str, run_id: str, step_id: str, buf: EventBuffer) -> None:
     """Phase 1: fresh start — load skill, read context, ask question."""
     update_step_status(org_id, run_id, step_id, "running")
-    write_event(
-        org_id, run_id, "step_started",
+    buf.append(
+        "step_started",
         step_id=step_id,
         payload={"stepId": step_id},
     )
 
     # Load SKILL.md
     skill = load_skill("/app/skills")
-    write_event(
-        org_id, run_id, "progress",
+    buf.append(
+        "progress",
         step_id=step_id,
         payload={"message": f"Loaded skill: {skill.name}"},
     )
 
     # Read context
-    write_event(
-        org_id, run_id, "agent_thinking",
+    buf.append(
+        "agent_thinking",
         step_id=step_id,
         payload={"thought": "Reading run context and preparing question..."},
     )
     context = read_run_context(org_id, run_id)
 
     # Ask user — this checkpoints and exits (never returns)
-    write_event(
-        org_id, run_id, "progress",
+    buf.append(
+        "progress",
         step_id=step_id,
         payload={"message": "Asking user for input", "percent": 20},
     )
+    buf.flush()
     ask_user(
         org_id, run_id, step_id,
         question="What is the main objective for this project? Please describe briefly.",
@@ -81,20 +81,21 @@ def _phase_after_question(
     org_id: str,
     run_id: str,
     step_id: str,
+    buf: EventBuffer,
     user_answer: str,
     checkpoint_data: dict,
 ) -> None:
     """Phase 2: user answered the question — build draft, request approval."""
     update_step_status(org_id, run_id, step_id, "running")
-    write_event(
-        org_id, run_id, "progress",
+    buf.append(
+        "progress",
         step_id=step_id,
         payload={"message": "Resumed — processing user answer", "percent": 40},
     )
 
     print(f"[step-agent] User answered: {user_answer}")
-    write_event(
-        org_id, run_id, "agent_tool_use",
+    buf.append(
+        "agent_tool_use",
         step_id=step_id,
         payload={
             "toolName": "ask_user",
@@ -104,13 +105,13 @@ def _phase_after_question(
     )
 
     # Build draft from user input
-    write_event(
-        org_id, run_id, "agent_thinking",
+    buf.append(
+        "agent_thinking",
         step_id=step_id,
         payload={"thought": "Building project summary draft from user input..."},
     )
-    write_event(
-        org_id, run_id, "progress",
+    buf.append(
+        "progress",
         step_id=step_id,
         payload={"message": "Generating draft document", "percent": 50},
     )
@@ -134,11 +135,12 @@ def _phase_after_question(
     )
 
     # Request approval — this checkpoints and exits (never returns)
-    write_event(
-        org_id, run_id, "progress",
+    buf.append(
+        "progress",
         step_id=step_id,
         payload={"message": "Requesting approval on draft", "percent": 70},
     )
+    buf.flush()
     request_approval(
         org_id, run_id, step_id,
         description="Please review the generated project summary draft.",
@@ -153,13 +155,14 @@ def _phase_after_approval(
     org_id: str,
     run_id: str,
     step_id: str,
+    buf: EventBuffer,
     decision: dict,
     checkpoint_data: dict,
 ) -> None:
     """Phase 3: user approved/rejected — write report, complete."""
     update_step_status(org_id, run_id, step_id, "running")
-    write_event(
-        org_id, run_id, "progress",
+    buf.append(
+        "progress",
         step_id=step_id,
         payload={"message": "Resumed — processing approval decision", "percent": 80},
     )
@@ -167,8 +170,8 @@ def _phase_after_approval(
     decision_value = decision.get("decision", "reject")
     print(f"[step-agent] Approval decision: {decision_value}")
 
-    write_event(
-        org_id, run_id, "agent_tool_use",
+    buf.append(
+        "agent_tool_use",
         step_id=step_id,
         payload={
             "toolName": "request_approval",
@@ -178,8 +181,8 @@ def _phase_after_approval(
     )
 
     # Build final report based on decision
-    write_event(
-        org_id, run_id, "progress",
+    buf.append(
+        "progress",
         step_id=step_id,
         payload={"message": "Writing final report", "percent": 90},
     )
@@ -204,11 +207,12 @@ def _phase_after_approval(
     clear_checkpoint(org_id, run_id, step_id)
 
     # Mark step as completed
-    write_event(
-        org_id, run_id, "step_completed",
+    buf.append(
+        "step_completed",
         step_id=step_id,
         payload={"resultSummary": summary},
     )
+    buf.flush()
     update_step_status(
         org_id, run_id, step_id, "completed",
         result_summary=summary,
@@ -236,20 +240,21 @@ def main() -> None:
     if resume_thread_id:
         print(f"[step-agent] Resuming from checkpoint (thread={resume_thread_id})")
 
+    buf = EventBuffer(org_id, run_id)
+
     try:
         if not resume_thread_id:
             # Fresh start
-            _phase_fresh(org_id, run_id, step_id)
+            _phase_fresh(org_id, run_id, step_id, buf)
         else:
             # Resume from checkpoint (stored in Firestore on the step doc)
-            checkpoint = load_checkpoint(org_id, run_id, step_id)
+            checkpoint, run_status = load_resume_state(org_id, run_id, step_id)
             if checkpoint is None:
                 raise RuntimeError(
                     f"RESUME_THREAD_ID set but no checkpoint found for step {step_id}"
                 )
 
             # Check if run was aborted while paused
-            run_status = read_run_status(org_id, run_id)
             if run_status == "aborted":
                 raise RunAbortedError("Run was aborted while step was paused")
 
@@ -269,13 +274,13 @@ def main() -> None:
 
             if phase == "waiting_for_answer":
                 user_answer = input_doc.get("payload", {}).get("answer", "")
-                _phase_after_question(org_id, run_id, step_id, user_answer, data)
+                _phase_after_question(org_id, run_id, step_id, buf, user_answer, data)
             elif phase == "waiting_for_approval":
                 decision = {
                     "decision": input_doc.get("payload", {}).get("decision", "reject"),
                     "revisedContent": input_doc.get("payload", {}).get("revisedContent"),
                 }
-                _phase_after_approval(org_id, run_id, step_id, decision, data)
+                _phase_after_approval(org_id, run_id, step_id, buf, decision, data)
             else:
                 raise RuntimeError(f"Unknown checkpoint phase: {phase}")
 
@@ -285,6 +290,7 @@ def main() -> None:
 
     except RunAbortedError:
         print("[step-agent] Run was aborted")
+        buf.flush()
         update_step_status(org_id, run_id, step_id, "skipped")
         clear_checkpoint(org_id, run_id, step_id)
         sys.exit(0)
@@ -294,11 +300,12 @@ def main() -> None:
         traceback.print_exc()
 
         try:
-            write_event(
-                org_id, run_id, "step_failed",
+            buf.append(
+                "step_failed",
                 step_id=step_id,
                 payload={"error": str(exc)},
             )
+            buf.flush()
             update_step_status(
                 org_id, run_id, step_id, "failed",
                 error={"code": "STEP_AGENT_CRASH", "message": str(exc)},
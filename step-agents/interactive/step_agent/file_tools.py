@@ -6,10 +6,14 @@ results, and produce completion reports on the shared persistent volume.
 
 from __future__ import annotations
 
+import mmap
 import os
 
 SHARED_ROOT = "/shared"
 
+# Directories already created by this process (skips repeat makedirs stats)
+_created_dirs: set[str] = set()
+
 
 def read_shared_file(path: str) -> str:
     """Read a file from the shared PVC.
@@ -20,12 +24,36 @@ def read_shared_file(path: str) -> str:
     Returns:
         File contents as a string.
 
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+    """
+    data = read_shared_file_bytes(path)
+    if isinstance(data, bytes):
+        return data.decode("utf-8")
+    with data:
+        return data[:].decode("utf-8")
+
+
+def read_shared_file_bytes(path: str) -> mmap.mmap | bytes:
+    """Map a file from the shared PVC read-only, without copying it.
+
+    Pages are loaded lazily by the OS, so callers that only scan or search
+    the content (``find``, ``re`` on bytes) never hold a full copy in memory.
+    The caller should close the returned mmap.  Empty files (which cannot be
+    mapped) return ``b""``.
+
     Raises:
         FileNotFoundError: If the file doesn't exist.
     """
     full_path = os.path.join(SHARED_ROOT, path)
-    with open(full_path, "r", encoding="utf-8") as f:
-        return f.read()
+    fd = os.open(full_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return b""
+        return mmap.mmap(fd, size, prot=mmap.PROT_READ)
+    finally:
+        os.close(fd)
 
 
 def write_shared_file(path: str, content: str) -> str:
@@ -39,9 +67,18 @@ def write_shared_file(path: str, content: str) -> str:
         The full absolute path of the written file.
     """
     full_path = os.path.join(SHARED_ROOT, path)
-    os.makedirs(os.path.dirname(full_path), exist_ok=True)
-    with open(full_path, "w", encoding="utf-8") as f:
-        f.write(content)
+    parent = os.path.dirname(full_path)
+    if parent not in _created_dirs:
+        os.makedirs(parent, exist_ok=True)
+        _created_dirs.add(parent)
+    # Encode once and write straight to the fd (no TextIOWrapper / buffering)
+    data = memoryview(content.encode("utf-8"))
+    fd = os.open(full_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
     return full_path
 
 
@@ -7,10 +7,14 @@ description) and extracts the markdown body as agent instructions.
 from __future__ import annotations
 
 import os
+import re
 from dataclasses import dataclass
-from pathlib import Path
 
-import yaml
+# Scalars YAML may not read as a plain string: booleans/null, and anything
+# starting like a number, timestamp, .inf/.nan, merge key or value indicator
+_NON_STRING_SCALAR_RE = re.compile(
+    r"(?i:true|false|yes|no|on|off|y|n|null)|[-+.0-9=<~?].*"
+)
 
 
 @dataclass
@@ -20,6 +24,63 @@ class SkillDefinition:
     body: str  # full markdown body (used as system prompt for LLM agents)
 
 
+# Parsed skills by skills_dir; /app/skills is baked into the image, so a
+# directory is only scanned and parsed once per process.
+_SKILL_CACHE: dict[str, SkillDefinition] = {}
+
+
+def _parse_flat_frontmatter(text: str) -> dict[str, str] | None:
+    """Parse frontmatter made only of ``key: value`` lines with string values.
+
+    SKILL.md frontmatter is just ``name`` and ``description``, so this covers
+    every real file without importing PyYAML.  Returns None for anything it
+    can't read exactly as YAML would (nesting, lists, comments, block or flow
+    syntax, escapes, non-string scalars) so the caller falls back to YAML.
+    """
+    parsed: dict[str, str] = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        if "\t" in line:
+            return None
+        key, sep, value = line.partition(":")
+        if (
+            not sep or not key or key != key.strip() or " #" in key
+            or key[0] in "[]{}&*!|>@%`,#\"'"
+            or _NON_STRING_SCALAR_RE.fullmatch(key)
+        ):
+            return None
+        value = value.strip()
+        if not value or ": " in value or " #" in value:
+            return None
+        quote = value[0]
+        if quote in "\"'":
+            inner = value[1:-1]
+            if len(value) < 2 or value[-1] != quote or quote in inner or "\\" in inner:
+                return None
+            value = inner
+        elif (
+            quote in "[]{}&*!|>@%`,#"
+            or value.endswith(":")
+            or _NON_STRING_SCALAR_RE.fullmatch(value)
+        ):
+            return None
+        parsed[key] = value
+    return parsed
+
+
+def _load_yaml(text: str):
+    """Full YAML fallback; PyYAML is only imported when a SKILL.md needs it."""
+    import yaml
+
+    # libyaml-backed loader when available (same safe semantics, much faster)
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+    return yaml.load(text, Loader=Loader)
+
+
 def _parse_skill_md(content: str) -> SkillDefinition:
     """Parse a SKILL.md content string into a SkillDefinition."""
     trimmed = content.strip()
@@ -33,7 +94,9 @@ def _parse_skill_md(content: str) -> SkillDefinition:
     yaml_str = trimmed[3:end_idx].strip()
     body = trimmed[end_idx + 3:].strip()
 
-    parsed = yaml.safe_load(yaml_str)
+    parsed = _parse_flat_frontmatter(yaml_str)
+    if parsed is None:
+        parsed = _load_yaml(yaml_str)
     if not parsed or not isinstance(parsed, dict):
         raise ValueError("SKILL.md YAML frontmatter is empty or not a mapping")
 
@@ -51,22 +114,26 @@ def load_skill(skills_dir: str = "/app/skills") -> SkillDefinition:
     Returns the parsed SkillDefinition.
     Raises FileNotFoundError if no SKILL.md is found.
     """
-    skills_path = Path(skills_dir)
-    if not skills_path.exists():
-        raise FileNotFoundError(f"Skills directory not found: {skills_dir}")
-
-    # Scan subdirectories for SKILL.md
-    for subdir in sorted(skills_path.iterdir()):
-        if subdir.is_dir():
-            skill_file = subdir / "SKILL.md"
-            if skill_file.exists():
-                content = skill_file.read_text(encoding="utf-8")
-                return _parse_skill_md(content)
-
-    # Also check for SKILL.md directly in skills_dir
-    direct = skills_path / "SKILL.md"
-    if direct.exists():
-        content = direct.read_text(encoding="utf-8")
-        return _parse_skill_md(content)
+    cached = _SKILL_CACHE.get(skills_dir)
+    if cached is not None:
+        return cached
+
+    # scandir entries carry their file type from the directory read, so only
+    # the SKILL.md checks cost a stat
+    try:
+        with os.scandir(skills_dir) as it:
+            subdirs = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Skills directory not found: {skills_dir}") from None
+
+    # Scan subdirectories for SKILL.md; also check for SKILL.md directly in skills_dir
+    candidates = [os.path.join(e.path, "SKILL.md") for e in subdirs]
+    candidates.append(os.path.join(skills_dir, "SKILL.md"))
+    for skill_file in candidates:
+        if os.path.isfile(skill_file):
+            with open(skill_file, encoding="utf-8") as f:
+                content = f.read()
+            skill = _SKILL_CACHE[skills_dir] = _parse_skill_md(content)
+            return skill
 
     raise FileNotFoundError(f"No SKILL.md found in {skills_dir}")
@@ -13,12 +13,12 @@ import sys
 import traceback
 
 from step_agent.firestore_client import (
+    EventBuffer,
     read_all_files,
     read_all_step_results,
     read_run_context,
     read_run_status,
     update_step_status,
-    write_event,
 )
 from step_agent.hitl_tools import RunAbortedError
 from step_agent.llm_client import generate
@@ -42,6 +42,8 @@ def main() -> None:
 
     print(f"[report-generator] Starting step={step_id} run={run_id} org={org_id}")
 
+    buf = EventBuffer(org_id, run_id)
+
     try:
         # Check for abort before starting
         run_status = read_run_status(org_id, run_id)
@@ -49,15 +51,15 @@ def main() -> None:
             raise RunAbortedError("Run was aborted before step started")
 
         update_step_status(org_id, run_id, step_id, "running")
-        write_event(
-            org_id, run_id, "step_started",
+        buf.append(
+            "step_started",
             step_id=step_id,
             payload={"stepId": step_id},
         )
 
         skill = load_skill("/app/skills")
-        write_event(
-            org_id, run_id, "progress",
+        buf.append(
+            "progress",
             step_id=step_id,
             payload={"message": f"Loaded skill: {skill.name}"},
         )
@@ -69,8 +71,8 @@ def main() -> None:
         manager = context.get("manager_email", "")
         start_date = context.get("start_date", "TBD")
 
-        write_event(
-            org_id, run_id, "progress",
+        buf.append(
+            "progress",
             step_id=step_id,
             payload={
                 "message": f"Reading results from all previous steps for {new_hire}",
@@ -85,8 +87,8 @@ def main() -> None:
         # Exclude self from report inputs
         prev_steps = [s for s in all_steps if s.get("id") != step_id]
 
-        write_event(
-            org_id, run_id, "progress",
+        buf.append(
+            "progress",
             step_id=step_id,
             payload={
                 "message": f"Compiling report from {len(prev_steps)} steps and {len(all_files)} artifacts with AI",
@@ -149,10 +151,11 @@ def main() -> None:
             ),
             max_tokens=4096,
             temperature=0.5,
+            buf=buf,
         )
 
-        write_event(
-            org_id, run_id, "progress",
+        buf.append(
+            "progress",
             step_id=step_id,
             payload={
                 "message": "Onboarding report compiled — uploading artifact",
@@ -172,11 +175,12 @@ def main() -> None:
             f"Compiled {len(prev_steps)} step results and {len(all_files)} artifacts "
             f"into a comprehensive executive summary."
         )
-        write_event(
-            org_id, run_id, "step_completed",
+        buf.append(
+            "step_completed",
             step_id=step_id,
             payload={"resultSummary": summary},
         )
+        buf.flush()
         update_step_status(
             org_id, run_id, step_id, "completed",
             result_summary=summary,
@@ -189,6 +193,7 @@ def main() -> None:
 
     except RunAbortedError:
         print("[report-generator] Run was aborted")
+        buf.flush()
         update_step_status(org_id, run_id, step_id, "skipped")
         sys.exit(0)
 
@@ -197,11 +202,12 @@ def main() -> None:
         traceback.print_exc()
 
         try:
-            write_event(
-                org_id, run_id, "step_failed",
+            buf.append(
+                "step_failed",
                 step_id=step_id,
                 payload={"error": str(exc)},
             )
+            buf.flush()
             update_step_status(
                 org_id, run_id, step_id, "failed",
                 error={"code": "STEP_AGENT_CRASH", "message": str(exc)},